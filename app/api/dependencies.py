@@ -14,8 +14,17 @@ from app.services.entities import EntityService
 from app.services.roles import RoleService
 
 
-def get_db_session() -> Session:
-    yield from get_session()
+__all__ = [
+    "get_authorization_service",
+    "get_db_session",
+    "get_entity_service",
+    "get_event_service",
+    "get_role_service",
+    "get_session",
+]
+
+# Alias rather than wrap: routes depending on either name share one session per request.
+get_db_session = get_session
 
 
 def get_entity_service(session: Session = Depends(get_db_session)) -> EntityService:
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+from typing import Dict, Type
+
 from fastapi import FastAPI, Request
+from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from app.events_engine.service import EventNotFoundError, EventServiceError
 from app.services.authorization import EntityNotFoundError as AuthEntityNotFoundError
@@ -17,43 +20,37 @@ from app.services.roles import (
 )
 
 
-def register_exception_handlers(app: FastAPI) -> None:
-    @app.exception_handler(EntityNotFoundError)
-    async def entity_not_found_handler(request: Request, exc: EntityNotFoundError) -> JSONResponse:  # noqa: WPS430
-        return JSONResponse(status_code=404, content={"detail": str(exc)})
-
-    @app.exception_handler(AuthEntityNotFoundError)
-    async def auth_entity_not_found_handler(request: Request, exc: AuthEntityNotFoundError) -> JSONResponse:  # noqa: WPS430
-        return JSONResponse(status_code=404, content={"detail": str(exc)})
+_STATUS_CODES: Dict[Type[Exception], int] = {
+    EntityNotFoundError: 404,
+    AuthEntityNotFoundError: 404,
+    RoleNotFoundError: 404,
+    EntityConflictError: 409,
+    RoleConflictError: 409,
+    PermissionScopeError: 400,
+    RoleServiceError: 400,
+    EventNotFoundError: 404,
+    EventServiceError: 502,
+}
 
-    @app.exception_handler(RequestValidationError)
-    async def validation_error_handler(request: Request, exc: RequestValidationError) -> JSONResponse:  # noqa: WPS430
-        return JSONResponse(status_code=400, content={"detail": exc.errors()})
 
-    @app.exception_handler(RoleNotFoundError)
-    async def role_not_found_handler(request: Request, exc: RoleNotFoundError) -> JSONResponse:  # noqa: WPS430
-        return JSONResponse(status_code=404, content={"detail": str(exc)})
+def _status_code_for(exc: Exception) -> int:
+    # Starlette dispatches on the most specific registered class; mirror that here.
+    for cls in type(exc).__mro__:
+        status_code = _STATUS_CODES.get(cls)
+        if status_code is not None:
+            return status_code
+    return 500
 
-    @app.exception_handler(EntityConflictError)
-    async def entity_conflict_handler(request: Request, exc: EntityConflictError) -> JSONResponse:  # noqa: WPS430
-        return JSONResponse(status_code=409, content={"detail": str(exc)})
 
-    @app.exception_handler(RoleConflictError)
-    async def role_conflict_handler(request: Request, exc: RoleConflictError) -> JSONResponse:  # noqa: WPS430
-        return JSONResponse(status_code=409, content={"detail": str(exc)})
+async def _service_error_handler(request: Request, exc: Exception) -> ORJSONResponse:
+    return ORJSONResponse(status_code=_status_code_for(exc), content={"detail": str(exc)})
 
-    @app.exception_handler(PermissionScopeError)
-    async def permission_scope_handler(request: Request, exc: PermissionScopeError) -> JSONResponse:  # noqa: WPS430
-        return JSONResponse(status_code=400, content={"detail": str(exc)})
 
-    @app.exception_handler(RoleServiceError)
-    async def role_service_handler(request: Request, exc: RoleServiceError) -> JSONResponse:  # noqa: WPS430
-        return JSONResponse(status_code=400, content={"detail": str(exc)})
-
-    @app.exception_handler(EventNotFoundError)
-    async def event_not_found_handler(request: Request, exc: EventNotFoundError) -> JSONResponse:  # noqa: WPS430
-        return JSONResponse(status_code=404, content={"detail": str(exc)})
+def register_exception_handlers(app: FastAPI) -> None:
+    for exc_class in _STATUS_CODES:
+        app.add_exception_handler(exc_class, _service_error_handler)
 
-    @app.exception_handler(EventServiceError)
-    async def event_service_error_handler(request: Request, exc: EventServiceError) -> JSONResponse:  # noqa: WPS430
-        return JSONResponse(status_code=502, content={"detail": str(exc)})
+    @app.exception_handler(RequestValidationError)
+    async def validation_error_handler(request: Request, exc: RequestValidationError) -> ORJSONResponse:  # noqa: WPS430
+        # errors() may carry exception objects in "ctx"; encode them before handing off to orjson.
+        return ORJSONResponse(status_code=400, content={"detail": jsonable_encoder(exc.errors())})
@@ -0,0 +1,33 @@
+"""HTTP conditional-request helpers for single-resource GET endpoints."""
+
+from __future__ import annotations
+
+import hashlib
+
+from fastapi import Request, Response, status
+from pydantic import BaseModel
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def conditional_json_response(request: Request, model: BaseModel) -> Response:
+    """Serialize ``model`` once and answer 304 when the client already holds this representation.
+
+    The ETag is a digest of the encoded body rather than of ``updated_at``, which
+    only has one-second resolution on SQLite and could miss quick successive edits.
+    """
+
+    body = model.model_dump_json().encode("utf-8")
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -0,0 +1,19 @@
+"""Response classes shared by routers that build JSON bodies by hand."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse
+
+
+class UTCJSONResponse(ORJSONResponse):
+    """orjson response that writes UTC datetimes with a ``Z`` suffix.
+
+    Matches what routes with a ``response_model`` emit through pydantic, so
+    hand-built bodies render timestamps the same way.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS)
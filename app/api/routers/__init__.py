@@ -1,5 +1,7 @@
 """Router registrations."""
 
+from functools import lru_cache
+
 from fastapi import APIRouter
 
 from app.api.routers import (
@@ -17,7 +19,10 @@ from app.api.routers import (
 )
 
 
+@lru_cache(maxsize=1)
 def get_api_router() -> APIRouter:
+    """Return the assembled API router, built once per process."""
+
     router = APIRouter()
     router.include_router(health.router, tags=["health"])
     router.include_router(entities.router, prefix="/api/v1/entities", tags=["entities"])
@@ -6,6 +6,7 @@ from typing import List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Header, Query, Response, status
+from pydantic import TypeAdapter
 
 from app.api.dependencies import get_role_service
 from app.models.role_assignment import RoleAssignment
@@ -14,6 +15,8 @@ from app.services.roles import RoleService
 
 router = APIRouter()
 
+_ASSIGNMENT_LIST_ADAPTER = TypeAdapter(List[RoleAssignmentResponse])
+
 
 @router.post(
     "",
@@ -39,7 +42,7 @@ def list_assignments(
     service: RoleService = Depends(get_role_service),
 ) -> List[RoleAssignmentResponse]:
     assignments = service.list_assignments(principal_id=principal_id, entity_id=entity_id)
-    return [_to_assignment_response(assignment) for assignment in assignments]
+    return _ASSIGNMENT_LIST_ADAPTER.validate_python(assignments, from_attributes=True)
 
 
 @router.delete(
@@ -56,14 +59,4 @@ def revoke_assignment(
 
 
 def _to_assignment_response(assignment: RoleAssignment) -> RoleAssignmentResponse:
-    return RoleAssignmentResponse(
-        id=assignment.id,
-        principal_id=assignment.principal_id,
-        principal_type=assignment.principal_type,
-        role_id=assignment.role_id,
-        entity_id=assignment.entity_id,
-        effective_at=assignment.effective_at,
-        expires_at=assignment.expires_at,
-        created_at=assignment.created_at,
-        updated_at=assignment.updated_at,
-    )
+    return RoleAssignmentResponse.model_validate(assignment, from_attributes=True)
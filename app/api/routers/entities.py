@@ -5,15 +5,19 @@ from __future__ import annotations
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Header, Query, status
+from fastapi import APIRouter, Depends, Header, Query, Request, Response, status
+from pydantic import TypeAdapter
 
 from app.api.dependencies import get_entity_service
+from app.api.http_cache import conditional_json_response
 from app.models.entity import EntityType
 from app.schemas.entity import EntityCreate, EntityResponse, EntityUpdate
 from app.services.entities import EntityService
 
 router = APIRouter()
 
+_ENTITY_LIST_ADAPTER = TypeAdapter(List[EntityResponse])
+
 
 @router.post(
     "",
@@ -35,10 +39,11 @@ def create_entity(
 )
 def get_entity(
     entity_id: UUID,
+    request: Request,
     service: EntityService = Depends(get_entity_service),
-) -> EntityResponse:
+) -> Response:
     entity = service.get(entity_id)
-    return EntityResponse.model_validate(entity, from_attributes=True)
+    return conditional_json_response(request, EntityResponse.model_validate(entity, from_attributes=True))
 
 
 @router.get(
@@ -54,7 +59,7 @@ def list_entities(
         types=[entity_type.value for entity_type in entity_types] if entity_types else None,
         parent_id=parent_id,
     )
-    return [EntityResponse.model_validate(entity, from_attributes=True) for entity in entities]
+    return _ENTITY_LIST_ADAPTER.validate_python(entities, from_attributes=True)
 
 
 @router.patch(
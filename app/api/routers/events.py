@@ -4,14 +4,18 @@ from __future__ import annotations
 
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from pydantic import TypeAdapter
 
 from app.api.dependencies import get_event_service
+from app.api.http_cache import conditional_json_response
 from app.events_engine.service import EventService
-from app.schemas.event import EventIngestRequest, EventResponse
+from app.schemas.event import EventIngestBatchRequest, EventIngestRequest, EventResponse
 
 router = APIRouter()
 
+_EVENT_LIST_ADAPTER = TypeAdapter(List[EventResponse])
+
 
 @router.post(
     "",
@@ -26,6 +30,19 @@ def ingest_event(
     return EventResponse.model_validate(record, from_attributes=True)
 
 
+@router.post(
+    "/batch",
+    response_model=List[EventResponse],
+    status_code=status.HTTP_201_CREATED,
+)
+def ingest_events(
+    payload: EventIngestBatchRequest,
+    service: EventService = Depends(get_event_service),
+) -> List[EventResponse]:
+    records = service.ingest_many(payload.events)
+    return _EVENT_LIST_ADAPTER.validate_python(records, from_attributes=True)
+
+
 @router.get(
     "",
     response_model=List[EventResponse],
@@ -37,7 +54,7 @@ def list_events(
     service: EventService = Depends(get_event_service),
 ) -> List[EventResponse]:
     records = service.list_events(event_type=event_type, source=source, limit=limit)
-    return [EventResponse.model_validate(record, from_attributes=True) for record in records]
+    return _EVENT_LIST_ADAPTER.validate_python(records, from_attributes=True)
 
 
 @router.get(
@@ -46,7 +63,8 @@ def list_events(
 )
 def get_event(
     event_id: str,
+    request: Request,
     service: EventService = Depends(get_event_service),
-) -> EventResponse:
+) -> Response:
     record = service.get_event(event_id)
-    return EventResponse.model_validate(record, from_attributes=True)
+    return conditional_json_response(request, EventResponse.model_validate(record, from_attributes=True))
@@ -8,5 +8,5 @@ router = APIRouter()
 
 
 @router.get("/healthz", summary="Liveness probe")
-def health_check() -> dict[str, str]:
+async def health_check() -> dict[str, str]:
     return {"status": "ok"}
@@ -3,15 +3,14 @@
 from __future__ import annotations
 
 from typing import Optional
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from fastapi import APIRouter, Depends, Header, status
-from sqlalchemy import select
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from app.api.dependencies import get_session
 from app.models.entity import Entity, EntityStatus, EntityType
-from app.models.role import Role
 from app.models.role_assignment import RoleAssignment
 from app.schemas.onboarding import (
     OnboardInvestorRequest,
@@ -19,8 +18,10 @@ from app.schemas.onboarding import (
     OnboardPropertyOwnerRequest,
 )
 from app.services.audit import AuditService
+from app.services.roles import get_role_id_by_name
 from app.workflow_orchestration.config import get_temporal_config
-from app.workflow_orchestration.starter import WorkflowStarter
+from app.workflow_orchestration.starter import WorkflowStarter, get_workflow_starter
+from app.workflow_orchestration.workflows.investor_onboarding import InvestorOnboardingWorkflow
 
 router = APIRouter()
 
@@ -42,50 +43,48 @@ def onboard_property_owner(
     """
     audit = AuditService(session)
     
-    # Create issuer entity
-    owner_entity = Entity(
-        name=payload.name,
-        type=EntityType.ISSUER,
-        status=EntityStatus.ACTIVE,
-        attributes={
-            "company_name": payload.company_name,
-            "contact_email": payload.contact_email,
-            "phone": payload.phone or "",
-            "address": payload.address or "",
-            "onboarding_status": "completed",
-            "kyc_status": "approved",  # Simplified for demo
-            **payload.attributes,
-        },
+    # Create issuer entity (Core inserts: nothing downstream needs the ORM objects)
+    owner_id = uuid4()
+    session.execute(
+        insert(Entity).values(
+            id=owner_id,
+            name=payload.name,
+            type=EntityType.ISSUER,
+            status=EntityStatus.ACTIVE,
+            attributes={
+                "company_name": payload.company_name,
+                "contact_email": payload.contact_email,
+                "phone": payload.phone or "",
+                "address": payload.address or "",
+                "onboarding_status": "completed",
+                "kyc_status": "approved",  # Simplified for demo
+                **payload.attributes,
+            },
+        )
     )
     
-    session.add(owner_entity)
-    session.flush()
-    
     # Assign PropertyOwner role
-    property_owner_role = session.scalar(
-        select(Role).where(Role.name == "PropertyOwner")
-    )
-    
+    role_id = get_role_id_by_name(session, "PropertyOwner")
     role_assigned = False
-    role_id = None
-    
-    if property_owner_role:
-        assignment = RoleAssignment(
-            principal_id=owner_entity.id,
-            principal_type="user",
-            role_id=property_owner_role.id,
-            entity_id=owner_entity.id,  # Scoped to their own entity
+    
+    if role_id:
+        session.execute(
+            insert(RoleAssignment).values(
+                id=uuid4(),
+                principal_id=owner_id,
+                principal_type="user",
+                role_id=role_id,
+                entity_id=owner_id,  # Scoped to their own entity
+            )
         )
-        session.add(assignment)
         role_assigned = True
-        role_id = property_owner_role.id
     
     # Record audit log
     audit.record(
         action="user.onboard",
         actor_id=x_actor_id,
-        entity_id=owner_entity.id,
-        entity_type=owner_entity.type.value,
+        entity_id=owner_id,
+        entity_type=EntityType.ISSUER.value,
         details={
             "user_type": "property_owner",
             "company_name": payload.company_name,
@@ -95,9 +94,9 @@ def onboard_property_owner(
     session.commit()
     
     return OnboardingResponse(
-        entity_id=owner_entity.id,
-        name=owner_entity.name,
-        entity_type=owner_entity.type.value,
+        entity_id=owner_id,
+        name=payload.name,
+        entity_type=EntityType.ISSUER.value,
         role_assigned=role_assigned,
         role_id=role_id,
         onboarding_status="completed",
@@ -110,7 +109,7 @@ def onboard_property_owner(
     response_model=OnboardingResponse,
     status_code=status.HTTP_201_CREATED,
 )
-async def onboard_investor(
+def onboard_investor(
     payload: OnboardInvestorRequest,
     session: Session = Depends(get_session),
     x_actor_id: Optional[UUID] = Header(default=None, alias="X-Actor-Id"),
@@ -125,50 +124,48 @@ async def onboard_investor(
     """
     audit = AuditService(session)
     
-    # Create investor entity
-    investor_entity = Entity(
-        name=payload.name,
-        type=EntityType.INVESTOR,
-        status=EntityStatus.ACTIVE,
-        attributes={
-            "email": payload.email,
-            "phone": payload.phone or "",
-            "investor_type": payload.investor_type,
-            "kyc_status": "pending",
-            "onboarding_status": "pending",
-            "token_holdings": {},
-            **payload.attributes,
-        },
+    # Create investor entity (Core inserts: nothing downstream needs the ORM objects)
+    investor_id = uuid4()
+    session.execute(
+        insert(Entity).values(
+            id=investor_id,
+            name=payload.name,
+            type=EntityType.INVESTOR,
+            status=EntityStatus.ACTIVE,
+            attributes={
+                "email": payload.email,
+                "phone": payload.phone or "",
+                "investor_type": payload.investor_type,
+                "kyc_status": "pending",
+                "onboarding_status": "pending",
+                "token_holdings": {},
+                **payload.attributes,
+            },
+        )
     )
     
-    session.add(investor_entity)
-    session.flush()
-    
     # Assign InvestorPending role
-    investor_pending_role = session.scalar(
-        select(Role).where(Role.name == "InvestorPending")
-    )
-    
+    role_id = get_role_id_by_name(session, "InvestorPending")
     role_assigned = False
-    role_id = None
-    
-    if investor_pending_role:
-        assignment = RoleAssignment(
-            principal_id=investor_entity.id,
-            principal_type="user",
-            role_id=investor_pending_role.id,
-            entity_id=None,  # Global assignment
+    
+    if role_id:
+        session.execute(
+            insert(RoleAssignment).values(
+                id=uuid4(),
+                principal_id=investor_id,
+                principal_type="user",
+                role_id=role_id,
+                entity_id=None,  # Global assignment
+            )
         )
-        session.add(assignment)
         role_assigned = True
-        role_id = investor_pending_role.id
     
     # Record audit log
     audit.record(
         action="user.onboard",
         actor_id=x_actor_id,
-        entity_id=investor_entity.id,
-        entity_type=investor_entity.type.value,
+        entity_id=investor_id,
+        entity_type=EntityType.INVESTOR.value,
         details={
             "user_type": "investor",
             "investor_type": payload.investor_type,
@@ -178,9 +175,9 @@ async def onboard_investor(
     session.commit()
     
     return OnboardingResponse(
-        entity_id=investor_entity.id,
-        name=investor_entity.name,
-        entity_type=investor_entity.type.value,
+        entity_id=investor_id,
+        name=payload.name,
+        entity_type=EntityType.INVESTOR.value,
         role_assigned=role_assigned,
         role_id=role_id,
         onboarding_status="pending",
@@ -196,6 +193,7 @@ async def onboard_investor(
 async def activate_investor(
     investor_id: UUID,
     session: Session = Depends(get_session),
+    starter: WorkflowStarter = Depends(get_workflow_starter),
     x_actor_id: Optional[UUID] = Header(default=None, alias="X-Actor-Id"),
 ) -> dict:
     """
@@ -204,8 +202,6 @@ async def activate_investor(
     Starts InvestorOnboardingWorkflow which verifies KYC documents,
     creates blockchain wallet, and upgrades permissions.
     """
-    from app.workflow_orchestration.workflows.investor_onboarding import InvestorOnboardingWorkflow
-    
     # Verify investor exists
     investor = session.get(Entity, investor_id)
     if not investor or investor.type != EntityType.INVESTOR:
@@ -226,8 +222,6 @@ async def activate_investor(
     
     # Start workflow
     workflow_id = f"investor-onboarding-{investor_id}"
-    starter = WorkflowStarter(config=temporal_config)
-    
     try:
         await starter.start_workflow(
             workflow_class=InvestorOnboardingWorkflow,
@@ -5,9 +5,10 @@ from __future__ import annotations
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Header, Query, status
+from fastapi import APIRouter, Depends, Header, Query, Request, Response, status
 
 from app.api.dependencies import get_session
+from app.api.http_cache import conditional_json_response
 from app.schemas.property import (
     PropertyCreate,
     PropertyListResponse,
@@ -17,7 +18,9 @@ from app.schemas.property import (
     TokenizePropertyResponse,
 )
 from app.services.properties import PropertyService
-from app.workflow_orchestration.starter import WorkflowStarter
+from app.workflow_orchestration.config import get_temporal_config
+from app.workflow_orchestration.starter import WorkflowStarter, get_workflow_starter
+from app.workflow_orchestration.workflows.property_onboarding import PropertyOnboardingWorkflow
 from sqlalchemy.orm import Session
 
 router = APIRouter()
@@ -74,12 +77,13 @@ def create_property(
 )
 def get_property(
     property_id: UUID,
+    request: Request,
     session: Session = Depends(get_session),
-) -> PropertyResponse:
+) -> Response:
     """Get property details by ID."""
     service = PropertyService(session)
     property_entity = service.get_property(property_id)
-    return _to_property_response(property_entity)
+    return conditional_json_response(request, _to_property_response(property_entity))
 
 
 @router.get(
@@ -105,7 +109,7 @@ def list_properties(
     service = PropertyService(session)
     
     offset = (page - 1) * page_size
-    properties = service.list_properties(
+    properties, total = service.list_properties_with_total(
         status=status,
         property_type=property_type,
         owner_id=owner_id,
@@ -113,12 +117,6 @@ def list_properties(
         offset=offset,
     )
     
-    total = service.get_property_count(
-        status=status,
-        property_type=property_type,
-        owner_id=owner_id,
-    )
-    
     return PropertyListResponse(
         properties=[_to_property_response(p) for p in properties],
         total=total,
@@ -152,6 +150,7 @@ def update_property(
 async def tokenize_property(
     payload: TokenizePropertyRequest,
     session: Session = Depends(get_session),
+    starter: WorkflowStarter = Depends(get_workflow_starter),
     x_actor_id: Optional[UUID] = Header(default=None, alias="X-Actor-Id"),
 ) -> TokenizePropertyResponse:
     """
@@ -163,9 +162,6 @@ async def tokenize_property(
     3. Mints tokens
     4. Activates property for investor trading
     """
-    from app.workflow_orchestration.workflows.property_onboarding import PropertyOnboardingWorkflow
-    from app.workflow_orchestration.config import get_temporal_config
-    
     # Verify property exists
     service = PropertyService(session)
     property_entity = service.get_property(payload.property_id)
@@ -182,8 +178,6 @@ async def tokenize_property(
     
     # Start workflow
     workflow_id = f"property-onboarding-{payload.property_id}"
-    starter = WorkflowStarter(config=temporal_config)
-    
     try:
         await starter.start_workflow(
             workflow_class=PropertyOnboardingWorkflow,
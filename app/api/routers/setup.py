@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict
-from uuid import UUID
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+from uuid import uuid4
 
 from fastapi import APIRouter, Depends, status
-from sqlalchemy import select
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import insert, select
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
 
 from app.api.dependencies import get_session
@@ -21,20 +23,102 @@ from app.models.permissions_constants import (
     get_property_owner_permissions,
 )
 from app.models.role import Role
+from app.models.role_permission import RolePermission
 from app.models.role_assignment import RoleAssignment
 
 router = APIRouter()
 logger = logging.getLogger("app.api.setup")
 
+# (name, description, scope_types, permissions) for the system roles seeded by /initialize-demo.
+# Permission lists come from the cached helpers, so they are referenced rather than called here.
+_ROLES_CONFIG: Tuple[Tuple[str, str, Tuple[str, ...], Callable[[], Tuple[str, ...]]], ...] = (
+    (
+        "Agent",
+        "Platform agent with full user and property management permissions",
+        (),  # No scope restriction - can access all entity types
+        get_agent_permissions,
+    ),
+    (
+        "PropertyOwner",
+        "Property owner who can list and manage properties",
+        ("issuer", "offering"),
+        get_property_owner_permissions,
+    ),
+    (
+        "InvestorPending",
+        "Pending investor with view-only access (before KYC approval)",
+        ("investor", "offering"),
+        get_investor_pending_permissions,
+    ),
+    (
+        "InvestorActive",
+        "Active investor who can trade tokens (after KYC approval)",
+        ("investor", "offering"),
+        get_investor_active_permissions,
+    ),
+)
+
+_NEXT_STEPS: Tuple[str, ...] = (
+    "1. Use agent_id as X-Actor-Id header for API calls",
+    "2. Onboard property owners: POST /api/v1/onboarding/property-owner",
+    "3. Onboard investors: POST /api/v1/onboarding/investor",
+    "4. Create properties: POST /api/v1/properties",
+    "5. Tokenize properties: POST /api/v1/properties/tokenize",
+    "6. Activate investors: POST /api/v1/onboarding/investor/{id}/activate",
+    "7. Purchase tokens: POST /api/v1/tokens/purchase",
+)
+
+# (name, company_name, email)
+_SAMPLE_OWNERS: Tuple[Tuple[str, str, str], ...] = (
+    ("Luxury Real Estate LLC", "Luxury Real Estate LLC", "owner@luxuryrealestate.com"),
+    ("Downtown Properties Inc", "Downtown Properties Inc", "owner@downtownproperties.com"),
+)
+
+# (name, email, investor_type)
+_SAMPLE_INVESTORS: Tuple[Tuple[str, str, str], ...] = (
+    ("John Investor", "john@investor.com", "individual"),
+    ("Jane Doe", "jane@doe.com", "individual"),
+    ("Institutional Fund LLC", "fund@institution.com", "institutional"),
+)
+
+# (name, property_type, address, valuation, total_tokens, token_price)
+_SAMPLE_PROPERTIES: Tuple[Tuple[str, str, str, int, int, int], ...] = (
+    ("Sunset Boulevard Apartments", "residential", "123 Sunset Blvd, Los Angeles, CA 90028", 5000000, 50000, 100),
+    ("Downtown Office Tower", "commercial", "456 Main St, New York, NY 10001", 15000000, 150000, 100),
+    ("Waterfront Condos", "residential", "789 Beach Rd, Miami, FL 33139", 8000000, 80000, 100),
+)
+
+
+def _insert_ignoring_conflicts(
+    session: Session,
+    model: type,
+    rows: List[Dict[str, Any]],
+    *,
+    conflict_columns: Sequence[str],
+) -> int:
+    """Insert ``rows`` in one statement, skipping ones that hit a unique constraint.
+
+    Returns the number of rows actually inserted.
+    """
+    if not rows:
+        return 0
+    dialect_name = session.get_bind().dialect.name
+    if dialect_name == "postgresql":
+        stmt = postgresql.insert(model).on_conflict_do_nothing(index_elements=list(conflict_columns))
+    elif dialect_name == "sqlite":
+        stmt = sqlite.insert(model).on_conflict_do_nothing(index_elements=list(conflict_columns))
+    else:
+        stmt = insert(model)
+    return session.execute(stmt.values(rows)).rowcount or 0
+
 
 @router.post(
     "/initialize-demo",
-    response_model=Dict[str, Any],
     status_code=status.HTTP_201_CREATED,
 )
 def initialize_demo(
     session: Session = Depends(get_session),
-) -> Dict[str, Any]:
+) -> ORJSONResponse:
     """
     Initialize demo environment with all required permissions, roles, and a demo agent.
     
@@ -47,6 +131,7 @@ def initialize_demo(
     """
     logger.info("initialize_demo_started")
     
+    # Ids stay as UUID objects; orjson writes them out natively when the response is rendered.
     result = {
         "permissions_created": 0,
         "roles_created": 0,
@@ -58,84 +143,52 @@ def initialize_demo(
     
     # Step 1: Create all permissions
     all_permissions = get_all_permissions()
-    permission_map = {}
-    
-    for action in all_permissions:
-        existing = session.scalar(
-            select(Permission).where(Permission.action == action)
-        )
-        
-        if not existing:
-            permission = Permission(action=action)
-            session.add(permission)
-            session.flush()
-            permission_map[action] = permission.id
-            result["permissions_created"] += 1
-            logger.info(f"permission_created: {action}")
-        else:
-            permission_map[action] = existing.id
-    
-    session.commit()
-    result["permission_ids"] = {k: str(v) for k, v in permission_map.items()}
+    existing_actions = set(
+        session.scalars(select(Permission.action).where(Permission.action.in_(all_permissions)))
+    )
+    missing_actions = [action for action in all_permissions if action not in existing_actions]
+    result["permissions_created"] = _insert_ignoring_conflicts(
+        session,
+        Permission,
+        [{"id": uuid4(), "action": action} for action in missing_actions],
+        conflict_columns=["action"],
+    )
+    if missing_actions:
+        logger.info("permissions_created", extra={"actions": missing_actions})
+    permission_map = dict(
+        session.execute(
+            select(Permission.action, Permission.id).where(Permission.action.in_(all_permissions))
+        ).all()
+    )
+    result["permission_ids"] = permission_map
     
     # Step 2: Create roles
-    roles_config = [
-        {
-            "name": "Agent",
-            "description": "Platform agent with full user and property management permissions",
-            "scope_types": [],  # No scope restriction - can access all entity types
-            "permissions": get_agent_permissions(),
-        },
-        {
-            "name": "PropertyOwner",
-            "description": "Property owner who can list and manage properties",
-            "scope_types": ["issuer", "offering"],
-            "permissions": get_property_owner_permissions(),
-        },
-        {
-            "name": "InvestorPending",
-            "description": "Pending investor with view-only access (before KYC approval)",
-            "scope_types": ["investor", "offering"],
-            "permissions": get_investor_pending_permissions(),
-        },
-        {
-            "name": "InvestorActive",
-            "description": "Active investor who can trade tokens (after KYC approval)",
-            "scope_types": ["investor", "offering"],
-            "permissions": get_investor_active_permissions(),
-        },
-    ]
-    
-    for role_config in roles_config:
-        existing_role = session.scalar(
-            select(Role).where(Role.name == role_config["name"])
-        )
-        
-        if not existing_role:
+    role_names = [name for name, _, _, _ in _ROLES_CONFIG]
+    role_ids = dict(session.execute(select(Role.name, Role.id).where(Role.name.in_(role_names))).all())
+    for name, description, scope_types, permissions_for in _ROLES_CONFIG:
+        if name not in role_ids:
             role = Role(
-                name=role_config["name"],
-                description=role_config["description"],
-                scope_types=role_config["scope_types"],
+                name=name,
+                description=description,
+                scope_types=list(scope_types),
                 is_system=True,
             )
             session.add(role)
             session.flush()
             
-            # Attach permissions
-            for action in role_config["permissions"]:
-                if action in permission_map:
-                    permission = session.get(Permission, permission_map[action])
-                    if permission:
-                        role.permissions.append(permission)
+            # Attach permissions straight through the association table; the ids are already known.
+            role_permission_rows = [
+                {"role_id": role.id, "permission_id": permission_map[action]}
+                for action in permissions_for()
+                if action in permission_map
+            ]
+            if role_permission_rows:
+                session.execute(insert(RolePermission), role_permission_rows)
             
-            session.flush()
+            role_ids[name] = role.id
             result["roles_created"] += 1
-            result["role_ids"][role_config["name"]] = str(role.id)
-            logger.info(f"role_created: {role_config['name']}")
-        else:
-            result["role_ids"][role_config["name"]] = str(existing_role.id)
-    
-    session.commit()
+            logger.info(f"role_created: {name}")
+        result["role_ids"][name] = role_ids[name]
     
     # Step 3: Create demo agent user
     existing_agent = session.scalar(
@@ -158,52 +211,42 @@ def initialize_demo(
         session.flush()
         
         # Assign Agent role
-        agent_role = session.scalar(
-            select(Role).where(Role.name == "Agent")
-        )
+        agent_role_id = role_ids.get("Agent")
         
-        if agent_role:
+        if agent_role_id:
             assignment = RoleAssignment(
                 principal_id=agent.id,
                 principal_type="user",
-                role_id=agent_role.id,
+                role_id=agent_role_id,
                 entity_id=None,  # Global assignment
             )
             session.add(assignment)
         
-        session.commit()
-        
         result["agent_created"] = True
-        result["agent_id"] = str(agent.id)
+        result["agent_id"] = agent.id
         logger.info(f"demo_agent_created: {agent.id}")
     else:
-        result["agent_id"] = str(existing_agent.id)
+        result["agent_id"] = existing_agent.id
+    
+    # Permissions, roles and the agent land in one transaction; flushes above only assign ids.
+    session.commit()
     
     logger.info("initialize_demo_completed", extra=result)
     
-    return {
+    return ORJSONResponse({
         **result,
         "message": "Demo environment initialized successfully",
-        "next_steps": [
-            "1. Use agent_id as X-Actor-Id header for API calls",
-            "2. Onboard property owners: POST /api/v1/onboarding/property-owner",
-            "3. Onboard investors: POST /api/v1/onboarding/investor",
-            "4. Create properties: POST /api/v1/properties",
-            "5. Tokenize properties: POST /api/v1/properties/tokenize",
-            "6. Activate investors: POST /api/v1/onboarding/investor/{id}/activate",
-            "7. Purchase tokens: POST /api/v1/tokens/purchase",
-        ],
-    }
+        "next_steps": _NEXT_STEPS,
+    }, status_code=status.HTTP_201_CREATED)
 
 
 @router.post(
     "/create-sample-data",
-    response_model=Dict[str, Any],
     status_code=status.HTTP_201_CREATED,
 )
 def create_sample_data(
     session: Session = Depends(get_session),
-) -> Dict[str, Any]:
+) -> ORJSONResponse:
     """
     Create sample data for demo purposes.
     
@@ -227,155 +270,112 @@ def create_sample_data(
     }
     
     # Get roles
-    property_owner_role = session.scalar(
-        select(Role).where(Role.name == "PropertyOwner")
-    )
-    investor_pending_role = session.scalar(
-        select(Role).where(Role.name == "InvestorPending")
+    role_ids = dict(
+        session.execute(
+            select(Role.name, Role.id).where(Role.name.in_(("PropertyOwner", "InvestorPending")))
+        ).all()
     )
+    property_owner_role_id = role_ids.get("PropertyOwner")
+    investor_pending_role_id = role_ids.get("InvestorPending")
     
     # Create property owners
-    owners_data = [
-        {
-            "name": "Luxury Real Estate LLC",
-            "company_name": "Luxury Real Estate LLC",
-            "email": "owner@luxuryrealestate.com",
-        },
-        {
-            "name": "Downtown Properties Inc",
-            "company_name": "Downtown Properties Inc",
-            "email": "owner@downtownproperties.com",
-        },
-    ]
-    
-    for owner_data in owners_data:
-        owner = Entity(
-            name=owner_data["name"],
+    owners = [
+        Entity(
+            id=uuid4(),
+            name=owner_name,
             type=EntityType.ISSUER,
             status=EntityStatus.ACTIVE,
             attributes={
-                "company_name": owner_data["company_name"],
-                "contact_email": owner_data["email"],
+                "company_name": company_name,
+                "contact_email": email,
                 "onboarding_status": "completed",
                 "kyc_status": "approved",
             },
         )
-        session.add(owner)
-        session.flush()
-        
-        if property_owner_role:
-            assignment = RoleAssignment(
+        for owner_name, company_name, email in _SAMPLE_OWNERS
+    ]
+    session.add_all(owners)
+    if property_owner_role_id:
+        session.add_all(
+            RoleAssignment(
                 principal_id=owner.id,
                 principal_type="user",
-                role_id=property_owner_role.id,
+                role_id=property_owner_role_id,
                 entity_id=owner.id,
             )
-            session.add(assignment)
-        
-        result["owners_created"] += 1
-        result["owner_ids"].append(str(owner.id))
-    
-    session.commit()
+            for owner in owners
+        )
+    result["owners_created"] = len(owners)
+    result["owner_ids"] = [owner.id for owner in owners]
     
     # Create investors
-    investors_data = [
-        {"name": "John Investor", "email": "john@investor.com", "type": "individual"},
-        {"name": "Jane Doe", "email": "jane@doe.com", "type": "individual"},
-        {"name": "Institutional Fund LLC", "email": "fund@institution.com", "type": "institutional"},
-    ]
-    
-    for investor_data in investors_data:
-        investor = Entity(
-            name=investor_data["name"],
+    investors = [
+        Entity(
+            id=uuid4(),
+            name=investor_name,
             type=EntityType.INVESTOR,
             status=EntityStatus.ACTIVE,
             attributes={
-                "email": investor_data["email"],
-                "investor_type": investor_data["type"],
+                "email": email,
+                "investor_type": investor_type,
                 "kyc_status": "pending",
                 "onboarding_status": "pending",
                 "token_holdings": {},
             },
         )
-        session.add(investor)
-        session.flush()
-        
-        if investor_pending_role:
-            assignment = RoleAssignment(
+        for investor_name, email, investor_type in _SAMPLE_INVESTORS
+    ]
+    session.add_all(investors)
+    if investor_pending_role_id:
+        session.add_all(
+            RoleAssignment(
                 principal_id=investor.id,
                 principal_type="user",
-                role_id=investor_pending_role.id,
+                role_id=investor_pending_role_id,
                 entity_id=None,
             )
-            session.add(assignment)
-        
-        result["investors_created"] += 1
-        result["investor_ids"].append(str(investor.id))
-    
-    session.commit()
+            for investor in investors
+        )
+    result["investors_created"] = len(investors)
+    result["investor_ids"] = [investor.id for investor in investors]
     
     # Create properties
-    owner_id = UUID(result["owner_ids"][0]) if result["owner_ids"] else None
+    owner_id = owners[0].id if owners else None
     
     if owner_id:
-        properties_data = [
-            {
-                "name": "Sunset Boulevard Apartments",
-                "type": "residential",
-                "address": "123 Sunset Blvd, Los Angeles, CA 90028",
-                "valuation": 5000000,
-                "total_tokens": 50000,
-                "token_price": 100,
-            },
-            {
-                "name": "Downtown Office Tower",
-                "type": "commercial",
-                "address": "456 Main St, New York, NY 10001",
-                "valuation": 15000000,
-                "total_tokens": 150000,
-                "token_price": 100,
-            },
-            {
-                "name": "Waterfront Condos",
-                "type": "residential",
-                "address": "789 Beach Rd, Miami, FL 33139",
-                "valuation": 8000000,
-                "total_tokens": 80000,
-                "token_price": 100,
-            },
-        ]
-        
-        for prop_data in properties_data:
-            property_entity = Entity(
-                name=prop_data["name"],
+        properties = [
+            Entity(
+                id=uuid4(),
+                name=property_name,
                 type=EntityType.OFFERING,
                 status=EntityStatus.ACTIVE,
                 parent_id=owner_id,
                 attributes={
-                    "property_type": prop_data["type"],
-                    "address": prop_data["address"],
-                    "valuation": prop_data["valuation"],
-                    "total_tokens": prop_data["total_tokens"],
-                    "token_price": prop_data["token_price"],
-                    "available_tokens": prop_data["total_tokens"],
+                    "property_type": property_type,
+                    "address": address,
+                    "valuation": valuation,
+                    "total_tokens": total_tokens,
+                    "token_price": token_price,
+                    "available_tokens": total_tokens,
                     "property_status": "pending",
                     "minimum_investment": 1000,
                 },
             )
-            session.add(property_entity)
-            session.flush()
-            
-            result["properties_created"] += 1
-            result["property_ids"].append(str(property_entity.id))
-        
-        session.commit()
+            for property_name, property_type, address, valuation, total_tokens, token_price in _SAMPLE_PROPERTIES
+        ]
+        session.add_all(properties)
+        result["properties_created"] = len(properties)
+        result["property_ids"] = [property_entity.id for property_entity in properties]
+    
+    # One flush for owners, investors, properties and assignments; the ORM batches each table's INSERTs.
+    session.commit()
     
     logger.info("create_sample_data_completed", extra=result)
     
-    return {
+    return ORJSONResponse({
         **result,
         "message": "Sample data created successfully",
-    }
+    }, status_code=status.HTTP_201_CREATED)
 
 
 
@@ -6,6 +6,7 @@ from typing import Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Header, status
+from temporalio.exceptions import WorkflowAlreadyStartedError
 
 from app.api.dependencies import get_session
 from app.schemas.token import (
@@ -15,7 +16,9 @@ from app.schemas.token import (
     TokenPurchaseResponse,
 )
 from app.services.tokens import TokenService
-from app.workflow_orchestration.starter import WorkflowStarter
+from app.workflow_orchestration.config import get_temporal_config
+from app.workflow_orchestration.starter import WorkflowStarter, get_workflow_starter
+from app.workflow_orchestration.workflows.token_purchase import TokenPurchaseWorkflow
 from sqlalchemy.orm import Session
 
 router = APIRouter()
@@ -47,6 +50,7 @@ async def get_token_details(
 async def purchase_tokens(
     payload: TokenPurchaseRequest,
     session: Session = Depends(get_session),
+    starter: WorkflowStarter = Depends(get_workflow_starter),
     x_actor_id: Optional[UUID] = Header(default=None, alias="X-Actor-Id"),
 ) -> TokenPurchaseResponse:
     """
@@ -59,9 +63,6 @@ async def purchase_tokens(
     4. Records transaction
     5. Updates token registry
     """
-    from app.workflow_orchestration.workflows.token_purchase import TokenPurchaseWorkflow
-    from app.workflow_orchestration.config import get_temporal_config
-    
     service = TokenService(session)
     
     # Validate purchase
@@ -99,8 +100,6 @@ async def purchase_tokens(
     
     # Start workflow
     workflow_id = f"token-purchase-{payload.investor_id}-{payload.property_id}"
-    starter = WorkflowStarter(config=temporal_config)
-    
     try:
         await starter.start_workflow(
             workflow_class=TokenPurchaseWorkflow,
@@ -123,6 +122,18 @@ async def purchase_tokens(
             status="started",
             message="Token purchase workflow started successfully",
         )
+    except WorkflowAlreadyStartedError:
+        # Only a still-running purchase for this investor/property blocks the id;
+        # completed ones are accepted again under Temporal's default reuse policy.
+        return TokenPurchaseResponse(
+            workflow_id=workflow_id,
+            investor_id=payload.investor_id,
+            property_id=payload.property_id,
+            token_quantity=payload.token_quantity,
+            payment_amount=payment_amount,
+            status="started",
+            message="Token purchase workflow already in progress",
+        )
     except Exception as exc:
         return TokenPurchaseResponse(
             workflow_id=workflow_id,
@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
-from typing import Dict
-
 from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
+from temporalio.client import WorkflowExecutionStatus
 
 from app.workflow_orchestration.client import get_temporal_client
 from app.workflow_orchestration.config import get_temporal_config
@@ -29,14 +28,13 @@ class DocumentVerificationTrigger(BaseModel):
 
 @router.post(
     "/document-verification/trigger",
-    response_model=Dict[str, str],
     status_code=status.HTTP_202_ACCEPTED,
     summary="Trigger Document Verification Workflow",
     description="Called by Document Vault service after document upload to start verification workflow",
 )
 async def trigger_document_verification(
     request: DocumentVerificationTrigger,
-) -> Dict[str, str]:
+) -> ORJSONResponse:
     """
     Trigger document verification workflow.
     
@@ -106,12 +104,15 @@ async def trigger_document_verification(
             },
         )
         
-        return {
-            "workflow_id": workflow_id,
-            "run_id": handle.first_execution_run_id,
-            "status": "started",
-            "message": "Document verification workflow started successfully",
-        }
+        return ORJSONResponse(
+            {
+                "workflow_id": workflow_id,
+                "run_id": handle.first_execution_run_id,
+                "status": "started",
+                "message": "Document verification workflow started successfully",
+            },
+            status_code=status.HTTP_202_ACCEPTED,
+        )
     
     except Exception as exc:
         logger.error(
@@ -130,14 +131,18 @@ async def trigger_document_verification(
 
 @router.get(
     "/document-verification/{workflow_id}/status",
-    response_model=Dict[str, str],
     summary="Get Document Verification Workflow Status",
     description="Check the status of a running document verification workflow",
 )
-async def get_workflow_status(workflow_id: str) -> Dict[str, str]:
+async def get_workflow_status(workflow_id: str) -> ORJSONResponse:
     """
     Get status of a document verification workflow.
     
+    ``status`` is the lower-cased Temporal execution status: ``running``,
+    ``completed``, ``failed``, ``canceled``, ``terminated``, ``timed_out`` or
+    ``continued_as_new``. Only ``completed`` responses include ``result``; a
+    failed workflow is reported as ``failed`` rather than as a 500 error.
+    
     Args:
         workflow_id: Workflow ID (format: document-verification-{document_id})
     
@@ -156,20 +161,19 @@ async def get_workflow_status(workflow_id: str) -> Dict[str, str]:
         client = await get_temporal_client(config)
         handle = client.get_workflow_handle(workflow_id)
         
-        # Try to get result (non-blocking)
-        try:
-            result = await asyncio.wait_for(handle.result(), timeout=0.1)
-            return {
+        # One DescribeWorkflowExecution RPC; only fetch the result once it is known to be ready.
+        description = await handle.describe()
+        workflow_status = (description.status or WorkflowExecutionStatus.RUNNING).name.lower()
+        if description.status == WorkflowExecutionStatus.COMPLETED:
+            return ORJSONResponse({
                 "workflow_id": workflow_id,
-                "status": "completed",
-                "result": result,
-            }
-        except asyncio.TimeoutError:
-            # Workflow still running
-            return {
-                "workflow_id": workflow_id,
-                "status": "running",
-            }
+                "status": workflow_status,
+                "result": await handle.result(),
+            })
+        return ORJSONResponse({
+            "workflow_id": workflow_id,
+            "status": workflow_status,
+        })
     
     except Exception as exc:
         logger.error(
@@ -2,8 +2,7 @@
 
 from __future__ import annotations
 
-from functools import lru_cache
-from typing import List, Literal
+from typing import Literal, Tuple
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -26,16 +25,22 @@ class AppSettings(BaseSettings):
     service_name: str = Field(default="omen-epr")
     database_url: str = Field(default="sqlite:///./data/epr.db")
     sql_echo: bool = Field(default=False)
+    database_pool_size: int = Field(default=10)
+    database_max_overflow: int = Field(default=20)
+    database_pool_recycle: int = Field(default=300)
+    database_pool_timeout: int = Field(default=30)
+    database_query_cache_size: int = Field(default=1200)
+    threadpool_workers: int | None = Field(default=None)
     log_level: str = Field(default="INFO")
     log_json: bool = Field(default=True)
-    cors_origins: List[str] | str = Field(default_factory=list)
-    default_permissions: List[str] = Field(
-        default_factory=lambda: [
+    cors_origins: Tuple[str, ...] | str = Field(default=())
+    default_permissions: Tuple[str, ...] = Field(
+        default=(
             "document:upload",
             "document:verify",
             "document:download",
             "document:archive",
-        ]
+        )
     )
     redis_url: str | None = Field(default=None)
     redis_token: str | None = Field(default=None)
@@ -58,12 +63,12 @@ class AppSettings(BaseSettings):
 
     @field_validator("cors_origins")
     @classmethod
-    def parse_cors_origins(cls, value: str | List[str] | None) -> List[str]:
+    def parse_cors_origins(cls, value: str | Tuple[str, ...] | None) -> Tuple[str, ...]:
+        if isinstance(value, tuple):
+            return value
         if value is None or value == "":
-            return []
-        if isinstance(value, str):
-            return [origin.strip() for origin in value.split(",") if origin.strip()]
-        return value
+            return ()
+        return tuple(origin for origin in (part.strip() for part in value.split(",")) if origin)
 
     @field_validator(
         "redis_url",
@@ -89,8 +94,21 @@ class AppSettings(BaseSettings):
         return value
 
 
-@lru_cache
+_settings: AppSettings | None = None
+
+
 def get_settings() -> AppSettings:
     """Return cached application settings instance."""
 
-    return AppSettings()
+    global _settings
+    settings = _settings
+    if settings is None:
+        settings = _settings = AppSettings()
+    return settings
+
+
+def clear_settings_cache() -> None:
+    """Drop the cached settings so the next call re-reads the environment."""
+
+    global _settings
+    _settings = None
@@ -2,19 +2,21 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import sys
-from datetime import datetime, timezone
-from typing import Any, Dict
+import time
+from decimal import Decimal
+from typing import Any, Dict, Tuple
 
-from app.core.config import AppSettings
+import orjson
 
+from app.core.config import AppSettings
 
-class JsonFormatter(logging.Formatter):
-    """A lightweight JSON log formatter."""
+# Extras may carry non-string keys (e.g. UUIDs).
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
 
-    _RESERVED_ATTRS = {
+_RESERVED_ATTRS = frozenset(
+    {
         "args",
         "asctime",
         "created",
@@ -38,35 +40,61 @@ class JsonFormatter(logging.Formatter):
         "thread",
         "threadName",
     }
+)
+
+
+def _json_default(value: Any) -> Any:
+    """Encode ``extra`` values orjson has no native support for.
+
+    UUIDs, datetimes, enums and dataclasses never reach this hook; the common
+    leftovers get a typed branch before falling back to ``str``.
+    """
+
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if isinstance(value, bytes):
+        return value.decode("utf-8", "replace")
+    return str(value)
+
+
+class JsonFormatter(logging.Formatter):
+    """A lightweight JSON log formatter."""
 
     def __init__(self, service_name: str) -> None:
         super().__init__()
         self.service_name = service_name
+        # (whole second, "YYYY-MM-DDTHH:MM:SS.") for the most recently formatted record.
+        self._timestamp_prefix: Tuple[int, str] = (-1, "")
+
+    def _timestamp(self, record: logging.LogRecord) -> str:
+        """Render ``record.created`` as ``YYYY-MM-DDTHH:MM:SS.mmmZ`` in UTC."""
+
+        second = int(record.created)
+        cached_second, prefix = self._timestamp_prefix
+        if cached_second != second:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S.", time.gmtime(second))
+            self._timestamp_prefix = (second, prefix)
+        return f"{prefix}{int(record.msecs):03d}Z"
 
     def format(self, record: logging.LogRecord) -> str:
         log_entry: Dict[str, Any] = {
-            "timestamp": datetime.fromtimestamp(record.created, tz=timezone.utc)
-            .isoformat()
-            .replace("+00:00", "Z"),
+            "timestamp": self._timestamp(record),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
             "service": self.service_name,
         }
 
-        extra = {
-            key: value
-            for key, value in record.__dict__.items()
-            if key not in self._RESERVED_ATTRS
-        }
-
+        extra = {key: value for key, value in record.__dict__.items() if key not in _RESERVED_ATTRS}
         if extra:
             log_entry["extra"] = extra
 
         if record.exc_info:
             log_entry["exception"] = self.formatException(record.exc_info)
 
-        return json.dumps(log_entry, default=str)
+        return orjson.dumps(log_entry, default=_json_default, option=_ORJSON_OPTIONS).decode("utf-8")
 
 
 def configure_logging(settings: AppSettings) -> None:
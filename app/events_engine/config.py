@@ -3,12 +3,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Tuple
 
 from app.core.config import AppSettings, get_settings
 
 
-@dataclass
+@dataclass(frozen=True)
 class EventEngineConfig:
     """Resolved configuration values for the events engine."""
 
@@ -16,10 +16,22 @@ class EventEngineConfig:
     source: str
 
 
+_cached_config: Optional[Tuple[AppSettings, EventEngineConfig]] = None
+
+
 def get_event_engine_config(settings: Optional[AppSettings] = None) -> EventEngineConfig:
     """Materialize events engine configuration from application settings."""
 
+    global _cached_config
+
     settings = settings or get_settings()
+    cached = _cached_config
+    if cached is not None and cached[0] is settings:
+        return cached[1]
+
     topic_arn = getattr(settings, "document_vault_topic_arn", None)
     source = getattr(settings, "document_event_source", "entity_permissions_core")
-    return EventEngineConfig(topic_arn=topic_arn, source=source)
+    config = EventEngineConfig(topic_arn=topic_arn, source=source)
+    # Keyed on the settings object itself (not id()), so a recycled id can never match.
+    _cached_config = (settings, config)
+    return config
@@ -4,10 +4,10 @@ from __future__ import annotations
 
 import logging
 import os
-from typing import Any, Dict
+from typing import Any, Dict, List, Tuple
 
 from app.core.database import session_scope
-from app.events_engine.consumers.base import SQSEventConsumer
+from app.events_engine.consumers.base import SQSEventConsumer, unwrap_sns_envelope
 from app.schemas.audit import AuditEvent
 from app.services.audit import AuditService
 
@@ -16,17 +16,23 @@ LOGGER = logging.getLogger("app.events_engine.consumers.audit")
 
 def _handle_audit_message(payload: Dict[str, Any]) -> None:
     event = AuditEvent.model_validate(payload)
+    _record_audit_events([event])
+
+
+def _record_audit_events(events: List[AuditEvent]) -> None:
+    """Append ``events`` to the audit chain in one transaction."""
+
     with session_scope() as session:
-        audit_service = AuditService(session)
-        entry = audit_service.record_event(event)
-        LOGGER.info(
-            "audit_event_ingested",
-            extra={
-                "sequence": entry.sequence,
-                "event_id": event.event_id,
-                "source": event.source,
-            },
-        )
+        entries = AuditService(session).record_events(events)
+        for event, entry in zip(events, entries):
+            LOGGER.info(
+                "audit_event_ingested",
+                extra={
+                    "sequence": entry.sequence,
+                    "event_id": event.event_id,
+                    "source": event.source,
+                },
+            )
 
 
 class AuditSQSEventConsumer(SQSEventConsumer):
@@ -50,6 +56,41 @@ class AuditSQSEventConsumer(SQSEventConsumer):
             max_messages=max_messages,
         )
 
+    def _process_messages(self, messages: List[Dict[str, Any]]) -> List[int]:
+        """Ingest a whole receive batch with one session and one commit.
+
+        If the batch transaction fails, fall back to one transaction per message
+        so a single bad event cannot hold back the rest of the batch.
+        """
+
+        parsed: List[Tuple[int, AuditEvent]] = []
+        for index, message in enumerate(messages):
+            try:
+                payload = unwrap_sns_envelope(message.get("Body", ""))
+                parsed.append((index, AuditEvent.model_validate(payload)))
+            except Exception as exc:  # noqa: BLE001 - intentionally broad for worker safety
+                LOGGER.exception("audit_event_invalid", extra={"error": str(exc)})
+
+        if not parsed:
+            return []
+
+        try:
+            _record_audit_events([event for _, event in parsed])
+        except Exception as exc:  # noqa: BLE001 - retried per message below
+            LOGGER.exception("audit_batch_ingest_failed", extra={"error": str(exc), "count": len(parsed)})
+        else:
+            return [index for index, _ in parsed]
+
+        handled: List[int] = []
+        for index, event in parsed:
+            try:
+                _record_audit_events([event])
+            except Exception as exc:  # noqa: BLE001 - intentionally broad for worker safety
+                LOGGER.exception("audit_event_ingest_failed", extra={"error": str(exc)})
+                continue
+            handled.append(index)
+        return handled
+
 
 def build_audit_consumer_from_env() -> AuditSQSEventConsumer:
     """Construct an audit consumer using standard environment variables."""
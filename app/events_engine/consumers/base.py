@@ -2,16 +2,28 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import time
-from typing import Any, Callable, Dict, Optional, Protocol
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Protocol
 
 import boto3
+import orjson
 from botocore.exceptions import BotoCoreError, ClientError
 
 LOGGER = logging.getLogger("app.events_engine.consumer")
 
+# DeleteMessageBatch accepts at most ten entries per call.
+SQS_DELETE_BATCH_LIMIT = 10
+
+
+@lru_cache(maxsize=None)
+def _sqs_client(region_name: Optional[str]):  # noqa: ANN202
+    """Shared SQS client per region so consumers reuse endpoint resolution and credentials."""
+
+    return boto3.session.Session().client("sqs", region_name=region_name)
+
 
 class EventHandler(Protocol):
     """Handler invoked for each deserialized message."""
@@ -23,11 +35,11 @@ class EventHandler(Protocol):
 def unwrap_sns_envelope(message_body: str) -> Dict[str, Any]:
     """Extract the inner payload when delivered via SNS -> SQS."""
 
-    payload = json.loads(message_body)
+    payload = orjson.loads(message_body)
     if isinstance(payload, dict) and "Message" in payload:
         inner = payload["Message"]
         if isinstance(inner, str):
-            return json.loads(inner)
+            return orjson.loads(inner)
         if isinstance(inner, dict):
             return inner
     return payload
@@ -48,15 +60,19 @@ class SQSEventConsumer:
     ) -> None:
         self._queue_url = queue_url
         self._handler = handler
-        self._receive_kwargs: Dict[str, Any] = {
+        receive_kwargs: Dict[str, Any] = {
             "QueueUrl": queue_url,
             "MaxNumberOfMessages": max_messages,
             "WaitTimeSeconds": wait_time_seconds,
             "MessageAttributeNames": ["All"],
         }
         if visibility_timeout is not None:
-            self._receive_kwargs["VisibilityTimeout"] = visibility_timeout
-        self._sqs = boto3.client("sqs", region_name=region_name)
+            receive_kwargs["VisibilityTimeout"] = visibility_timeout
+        self._receive_kwargs: Mapping[str, Any] = MappingProxyType(receive_kwargs)
+        self._sqs = _sqs_client(region_name)
+        # Bound once; the polling loop calls these on every iteration.
+        self._receive = self._sqs.receive_message
+        self._delete_batch = self._sqs.delete_message_batch
 
     def run_forever(self) -> None:
         LOGGER.info("Starting SQS consumer", extra={"queue_url": self._queue_url})
@@ -71,24 +87,51 @@ class SQSEventConsumer:
             if not messages:
                 continue
 
-            for message in messages:
-                receipt_handle = message["ReceiptHandle"]
-                try:
-                    body = message.get("Body", "")
-                    payload = unwrap_sns_envelope(body)
-                    self._handler(payload)
-                except Exception as exc:  # noqa: BLE001 - intentionally broad for worker safety
-                    LOGGER.exception("Failed to process message", extra={"error": str(exc)})
-                    continue
-
-                try:
-                    self._sqs.delete_message(QueueUrl=self._queue_url, ReceiptHandle=receipt_handle)
-                except (BotoCoreError, ClientError) as exc:  # pragma: no cover - resiliency
-                    LOGGER.exception(
-                        "Failed to delete message",
-                        extra={"error": str(exc), "receipt_handle": receipt_handle},
-                    )
+            self._handle_messages(messages)
+
+    def _handle_messages(self, messages: List[Dict[str, Any]]) -> None:
+        """Process one receive batch, then delete the successfully handled messages together."""
+
+        to_delete = [
+            {"Id": str(index), "ReceiptHandle": messages[index]["ReceiptHandle"]}
+            for index in self._process_messages(messages)
+        ]
+
+        for start in range(0, len(to_delete), SQS_DELETE_BATCH_LIMIT):
+            entries = to_delete[start : start + SQS_DELETE_BATCH_LIMIT]
+            try:
+                response = self._delete_batch(QueueUrl=self._queue_url, Entries=entries)
+            except (BotoCoreError, ClientError) as exc:  # pragma: no cover - resiliency
+                LOGGER.exception(
+                    "Failed to delete messages",
+                    extra={"error": str(exc), "count": len(entries)},
+                )
+                continue
+            for failure in response.get("Failed", []):
+                LOGGER.error(
+                    "Failed to delete message",
+                    extra={
+                        "id": failure.get("Id"),
+                        "code": failure.get("Code"),
+                        "error": failure.get("Message"),
+                    },
+                )
+
+    def _process_messages(self, messages: List[Dict[str, Any]]) -> List[int]:
+        """Feed each message to the handler; returns the indexes that were handled."""
+
+        handled: List[int] = []
+        for index, message in enumerate(messages):
+            try:
+                body = message.get("Body", "")
+                payload = unwrap_sns_envelope(body)
+                self._handler(payload)
+            except Exception as exc:  # noqa: BLE001 - intentionally broad for worker safety
+                LOGGER.exception("Failed to process message", extra={"error": str(exc)})
+                continue
+            handled.append(index)
+        return handled
 
     def _receive_messages(self) -> list[Dict[str, Any]]:
-        response = self._sqs.receive_message(**self._receive_kwargs)
+        response = self._receive(**self._receive_kwargs)
         return response.get("Messages", [])
@@ -4,17 +4,19 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime, timezone
-from typing import Dict, Optional
+from threading import Lock
+from typing import Dict, List, Optional, Sequence
 
 from sqlalchemy.orm import Session
 
 from app.core.config import get_settings
 from app.events_engine.config import get_event_engine_config
-from app.events_engine.publisher import EventPublisher, NullEventPublisher, SnsEventPublisher
-from app.events_engine.schemas import EventEnvelope
+from app.events_engine.publisher import EventPublisher, NullEventPublisher, PublishBatchError, SnsEventPublisher
+from app.events_engine.schemas import EventEnvelope, ensure_utc
 from app.models.platform_event import DeliveryState, PlatformEvent
 
 _dispatcher: Optional["EventDispatcher"] = None
+_dispatcher_lock = Lock()
 
 LOGGER = logging.getLogger("app.events_engine.dispatcher")
 
@@ -47,17 +49,89 @@ class EventDispatcher:
     ) -> PlatformEvent:
         """Persist an event record and emit it through the configured publisher."""
 
-        envelope = EventEnvelope(
+        envelope = self.build_envelope(
+            event_type=event_type,
+            payload=payload,
+            source=source,
+            correlation_id=correlation_id,
+            occurred_at=occurred_at,
+            schema_version=schema_version,
+            metadata=metadata,
+        )
+
+        record = self._to_record(envelope)
+        session.add(record)
+        session.flush()
+
+        self._publish_with_retry(session, record, envelope)
+        return record
+
+    def build_envelope(
+        self,
+        *,
+        event_type: str,
+        payload: Dict[str, object],
+        source: Optional[str] = None,
+        correlation_id: Optional[str] = None,
+        occurred_at: Optional[datetime] = None,
+        schema_version: str = "v1",
+        metadata: Optional[Dict[str, object]] = None,
+    ) -> EventEnvelope:
+        """Normalize event fields into an envelope, defaulting source and timestamp."""
+
+        # Callers pass values already validated at the API boundary (or produced
+        # internally), so skip a second round of field validation.
+        return EventEnvelope.model_construct(
             event_type=event_type,
             payload=payload,
             source=source or self._default_source,
             correlation_id=correlation_id,
-            occurred_at=occurred_at or datetime.now(timezone.utc),
+            occurred_at=ensure_utc(occurred_at) if occurred_at else datetime.now(timezone.utc),
             schema_version=schema_version,
             metadata=metadata or {},
         )
 
-        record = PlatformEvent(
+    def publish_events(self, session: Session, envelopes: Sequence[EventEnvelope]) -> List[PlatformEvent]:
+        """Persist several envelopes with a single flush, then emit each of them."""
+
+        records = [self._to_record(envelope) for envelope in envelopes]
+        if not records:
+            return records
+        # As in AuditService.record_events: no server defaults, so no RETURNING on the insert.
+        now = datetime.now(timezone.utc)
+        for record in records:
+            record.created_at = record.updated_at = now
+        session.add_all(records)
+        session.flush()
+
+        pending = list(zip(records, envelopes))
+        publish_batch = getattr(self._publisher, "publish_batch", None)
+        if publish_batch is not None:
+            try:
+                publish_batch(list(envelopes))
+                pending = []
+            except PublishBatchError as exc:
+                failed_ids = {envelope.event_id for envelope in exc.failed}
+                pending = [(record, envelope) for record, envelope in pending if envelope.event_id in failed_ids]
+            except Exception:  # noqa: BLE001 - every envelope is retried individually below
+                LOGGER.exception("events_engine_publish_batch_failed", extra={"count": len(records)})
+
+            undelivered = {id(record) for record, _ in pending}
+            for record in records:
+                if id(record) not in undelivered:
+                    record.delivery_state = DeliveryState.SUCCEEDED
+                    record.delivery_attempts = 1
+                    record.last_error = None
+            session.flush()
+
+        # Anything the batch call did not deliver goes through the regular retry path.
+        for record, envelope in pending:
+            self._publish_with_retry(session, record, envelope)
+        return records
+
+    @staticmethod
+    def _to_record(envelope: EventEnvelope) -> PlatformEvent:
+        return PlatformEvent(
             event_id=str(envelope.event_id),
             event_type=envelope.event_type,
             source=envelope.source,
@@ -67,11 +141,6 @@ class EventDispatcher:
             payload=envelope.payload,
             context=envelope.metadata,
         )
-        session.add(record)
-        session.flush()
-
-        self._publish_with_retry(session, record, envelope)
-        return record
 
     def _publish_with_retry(self, session: Session, record: PlatformEvent, envelope: EventEnvelope) -> None:
         attempts = 0
@@ -123,9 +192,17 @@ def get_event_dispatcher() -> EventDispatcher:
     """Return the singleton event dispatcher for the application."""
 
     global _dispatcher
-    if _dispatcher is not None:
+    dispatcher = _dispatcher
+    if dispatcher is not None:
+        return dispatcher
+
+    with _dispatcher_lock:
+        if _dispatcher is None:
+            _dispatcher = _build_event_dispatcher()
         return _dispatcher
 
+
+def _build_event_dispatcher() -> EventDispatcher:
     settings = get_settings()
     config = get_event_engine_config(settings)
 
@@ -137,12 +214,11 @@ def get_event_dispatcher() -> EventDispatcher:
     else:
         publisher = NullEventPublisher()
 
-    _dispatcher = EventDispatcher(
+    return EventDispatcher(
         publisher=publisher,
         default_source=config.source,
         max_attempts=settings.event_publish_attempts,
     )
-    return _dispatcher
 
 
 def set_event_dispatcher(dispatcher: Optional[EventDispatcher]) -> None:
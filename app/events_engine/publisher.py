@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-import json
 import logging
-from typing import Protocol
+from functools import lru_cache
+from typing import Any, Dict, List, Protocol, Sequence
 
 import boto3
 from botocore.exceptions import BotoCoreError, ClientError
@@ -13,6 +13,24 @@ from app.events_engine.schemas import EventEnvelope
 
 LOGGER = logging.getLogger("app.events_engine.publisher")
 
+@lru_cache(maxsize=None)
+def _sns_client(region_name: str):  # noqa: ANN202
+    """Shared SNS client per region; botocore clients are thread-safe once built."""
+
+    return boto3.session.Session().client("sns", region_name=region_name)
+
+
+# PublishBatch accepts at most ten entries per call.
+SNS_PUBLISH_BATCH_LIMIT = 10
+
+
+class PublishBatchError(RuntimeError):
+    """Raised when some entries of a batch publish were rejected."""
+
+    def __init__(self, failed: List[EventEnvelope]) -> None:
+        super().__init__(f"{len(failed)} event(s) failed to publish")
+        self.failed = failed
+
 
 class EventPublisher(Protocol):
     """Transport abstraction for event delivery."""
@@ -30,16 +48,20 @@ class NullEventPublisher(EventPublisher):
             extra={"event_id": str(envelope.event_id), "event_type": envelope.event_type},
         )
 
+    def publish_batch(self, envelopes: Sequence[EventEnvelope]) -> None:
+        for envelope in envelopes:
+            self.publish(envelope)
+
 
 class SnsEventPublisher(EventPublisher):
     """Publishes events to an AWS SNS topic."""
 
     def __init__(self, *, topic_arn: str, region_name: str) -> None:
         self._topic_arn = topic_arn
-        self._client = boto3.client("sns", region_name=region_name)
+        self._client = _sns_client(region_name)
 
     def publish(self, envelope: EventEnvelope) -> None:
-        message = json.dumps(envelope.model_dump(mode="json"))
+        message = envelope.to_json_bytes().decode("utf-8")
         try:
             self._client.publish(
                 TopicArn=self._topic_arn,
@@ -61,3 +83,55 @@ class SnsEventPublisher(EventPublisher):
                 },
             )
             raise exc
+
+    def publish_batch(self, envelopes: Sequence[EventEnvelope]) -> None:
+        """Publish up to ten envelopes per SNS call.
+
+        Raises ``PublishBatchError`` listing the rejected envelopes when SNS reports
+        per-entry failures; transport errors propagate unchanged.
+        """
+
+        failed: List[EventEnvelope] = []
+        for start in range(0, len(envelopes), SNS_PUBLISH_BATCH_LIMIT):
+            chunk = envelopes[start : start + SNS_PUBLISH_BATCH_LIMIT]
+            try:
+                response = self._client.publish_batch(
+                    TopicArn=self._topic_arn,
+                    PublishBatchRequestEntries=[
+                        self._batch_entry(str(index), envelope) for index, envelope in enumerate(chunk)
+                    ],
+                )
+            except (BotoCoreError, ClientError) as exc:  # pragma: no cover - rely on logging/alerts
+                LOGGER.exception(
+                    "events_engine_publish_batch_failed",
+                    extra={"count": len(chunk), "topic_arn": self._topic_arn},
+                )
+                raise exc
+            for failure in response.get("Failed", []):
+                envelope = chunk[int(failure["Id"])]
+                LOGGER.error(
+                    "events_engine_publish_failed",
+                    extra={
+                        "event_id": str(envelope.event_id),
+                        "event_type": envelope.event_type,
+                        "topic_arn": self._topic_arn,
+                        "code": failure.get("Code"),
+                        "error": failure.get("Message"),
+                    },
+                )
+                failed.append(envelope)
+        if failed:
+            raise PublishBatchError(failed)
+
+    @staticmethod
+    def _batch_entry(entry_id: str, envelope: EventEnvelope) -> Dict[str, Any]:
+        return {
+            "Id": entry_id,
+            "Message": envelope.to_json_bytes().decode("utf-8"),
+            "MessageAttributes": {
+                "event_type": {
+                    "DataType": "String",
+                    "StringValue": envelope.event_type,
+                }
+            },
+        }
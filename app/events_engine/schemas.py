@@ -6,12 +6,23 @@ from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field, field_validator
+import orjson
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
+
+
+def ensure_utc(value: datetime) -> datetime:
+    """Treat naive datetimes as UTC and convert aware ones to UTC."""
+
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
 
 
 class EventEnvelope(BaseModel):
     """Canonical platform event payload used for SNS fan-out and storage."""
 
+    model_config = ConfigDict(frozen=True)
+
     event_id: UUID = Field(default_factory=uuid4)
     event_type: str = Field(..., min_length=3, max_length=128)
     source: str = Field(..., min_length=3, max_length=128)
@@ -24,9 +35,33 @@ class EventEnvelope(BaseModel):
     payload: Dict[str, Any] = Field(default_factory=dict)
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
+    _json: Optional[bytes] = PrivateAttr(default=None)
+
     @field_validator("occurred_at")
     @classmethod
     def _ensure_utc(cls, value: datetime) -> datetime:
-        if value.tzinfo is None:
-            return value.replace(tzinfo=timezone.utc)
-        return value.astimezone(timezone.utc)
+        return ensure_utc(value)
+
+    def to_json_bytes(self) -> bytes:
+        """Serialized envelope, encoded once and reused across publish attempts."""
+
+        encoded = self._json
+        if encoded is None:
+            # The envelope has a small fixed shape, so build the dict directly rather than
+            # going through model_dump(); orjson writes the UUID and UTC datetime natively.
+            encoded = orjson.dumps(
+                {
+                    "event_id": self.event_id,
+                    "event_type": self.event_type,
+                    "source": self.source,
+                    "occurred_at": self.occurred_at,
+                    "correlation_id": self.correlation_id,
+                    "schema_version": self.schema_version,
+                    "payload": self.payload,
+                    "metadata": self.metadata,
+                },
+                default=str,
+                option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS,
+            )
+            self._json = encoded
+        return encoded
@@ -4,14 +4,50 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import ColumnElement, Select, bindparam, func, literal, select, tuple_, update
 from sqlalchemy.orm import Session
 
-from app.events_engine import EventDispatcher, get_event_dispatcher
+from app.events_engine import EventDispatcher, EventEnvelope, get_event_dispatcher
+from app.models.entity import Entity
 from app.models.platform_event import PlatformEvent
+from app.models.types import JSONType
+from app.schemas.audit import AuditEvent
 from app.schemas.event import EventIngestRequest
+from app.services.audit import AuditService
+from app.services.token_registry import invalidate_token_details_on_commit
+from app.workflow_orchestration.orchestrator import get_workflow_orchestrator
+from app.workflow_orchestration.signal_sender import get_signal_dispatcher
+
+
+# Hot statements are built once with bind parameters; executing a prebuilt statement
+# skips constructing the select() tree on every request.
+_DEDUP_STATEMENT = (
+    select(PlatformEvent)
+    .where(PlatformEvent.source == bindparam("source"))
+    .where(PlatformEvent.correlation_id == bindparam("correlation_id"))
+    .limit(1)
+)
+_GET_EVENT_STATEMENT = select(PlatformEvent).where(PlatformEvent.event_id == bindparam("event_id"))
+
+
+def _list_statement(*, by_event_type: bool, by_source: bool) -> Select:
+    stmt = select(PlatformEvent).order_by(PlatformEvent.occurred_at.desc()).limit(bindparam("limit"))
+    if by_event_type:
+        stmt = stmt.where(PlatformEvent.event_type == bindparam("event_type"))
+    if by_source:
+        stmt = stmt.where(PlatformEvent.source == bindparam("source"))
+    return stmt
+
+
+# Keyed by (filter on event_type, filter on source).
+_LIST_STATEMENTS: Dict[Tuple[bool, bool], Select] = {
+    (by_event_type, by_source): _list_statement(by_event_type=by_event_type, by_source=by_source)
+    for by_event_type in (False, True)
+    for by_source in (False, True)
+}
 
 
 class EventServiceError(RuntimeError):
@@ -35,9 +71,8 @@ class EventService:
 
         if request.correlation_id:
             existing = self._session.scalar(
-                select(PlatformEvent)
-                .where(PlatformEvent.source == request.source)
-                .where(PlatformEvent.correlation_id == request.correlation_id)
+                _DEDUP_STATEMENT,
+                {"source": request.source, "correlation_id": request.correlation_id},
             )
             if existing:
                 self._logger.info(
@@ -79,144 +114,236 @@ class EventService:
             },
         )
 
+        self._after_ingest([record])
+        return record
+
+    def ingest_many(self, requests: Sequence[EventIngestRequest]) -> List[PlatformEvent]:
+        """Persist and publish several events with batched lookups and writes.
+
+        Returns one record per request, in order. Requests whose ``(source,
+        correlation_id)`` was already ingested, earlier or within the same batch,
+        resolve to that record instead of creating a new event.
+        """
+
+        existing = self._find_existing(requests)
+        results: List[PlatformEvent | int] = []
+        envelopes: List[EventEnvelope] = []
+        pending: Dict[Tuple[str, str], int] = {}
+        for request in requests:
+            key = (request.source, request.correlation_id) if request.correlation_id else None
+            if key is not None and key in existing:
+                results.append(existing[key])
+                continue
+            if key is not None and key in pending:
+                results.append(pending[key])
+                continue
+            if key is not None:
+                pending[key] = len(envelopes)
+            results.append(len(envelopes))
+            envelopes.append(
+                self._dispatcher.build_envelope(
+                    event_type=request.event_type,
+                    payload=request.payload,
+                    source=request.source,
+                    correlation_id=request.correlation_id,
+                    occurred_at=request.occurred_at or datetime.now(timezone.utc),
+                    schema_version=request.schema_version,
+                    metadata=request.context,
+                )
+            )
+
         try:
-            from app.workflow_orchestration import get_workflow_orchestrator
+            records = self._dispatcher.publish_events(self._session, envelopes)
+        except Exception as exc:  # noqa: BLE001
+            self._logger.exception("event_ingest_batch_failed", extra={"count": len(envelopes)})
+            raise EventServiceError("Failed to publish events") from exc
+
+        self._logger.info(
+            "event_ingest_batch_success",
+            extra={"count": len(records), "deduplicated": len(requests) - len(records)},
+        )
+        self._after_ingest(records)
+        return [records[item] if isinstance(item, int) else item for item in results]
+
+    def _find_existing(self, requests: Sequence[EventIngestRequest]) -> Dict[Tuple[str, str], PlatformEvent]:
+        keys = {(request.source, request.correlation_id) for request in requests if request.correlation_id}
+        if not keys:
+            return {}
+        stmt = select(PlatformEvent).where(
+            tuple_(PlatformEvent.source, PlatformEvent.correlation_id).in_(list(keys))
+        )
+        existing: Dict[Tuple[str, str], PlatformEvent] = {}
+        for record in self._session.scalars(stmt):
+            existing.setdefault((record.source, record.correlation_id), record)
+        return existing
+
+    def _after_ingest(self, records: Sequence[PlatformEvent]) -> None:
+        """Run workflow routing and event-specific handlers for newly stored events."""
 
-            orchestrator = get_workflow_orchestrator()
-            orchestrator.handle_event(record)
+        self._start_workflows(records)
+
+        by_type: Dict[str, List[PlatformEvent]] = {}
+        for record in records:
+            if record.event_type in self._EVENT_HANDLERS:
+                by_type.setdefault(record.event_type, []).append(record)
+        for event_type, batch in by_type.items():
+            self._EVENT_HANDLERS[event_type](self, batch)
+
+    def _start_workflows(self, records: Sequence[PlatformEvent]) -> None:
+        try:
+            get_workflow_orchestrator().handle_events(records)
         except Exception:  # noqa: BLE001
             self._logger.exception(
                 "event_workflow_dispatch_failed",
-                extra={"event_id": record.event_id, "event_type": record.event_type},
+                extra={"event_ids": [record.event_id for record in records]},
             )
-        
-        # Send signal to waiting workflows for document.verified events
-        if record.event_type == "document.verified":
+
+    def _enqueue_document_verified_signals(self, records: Sequence[PlatformEvent]) -> None:
+        """Send a signal to waiting workflows for document.verified events."""
+
+        for record in records:
             try:
-                import asyncio
-                from concurrent.futures import ThreadPoolExecutor
-                from app.workflow_orchestration.signal_sender import get_signal_sender
-                
                 entity_id = record.payload.get("entity_id")
                 entity_type = record.payload.get("entity_type")
-                
+
                 if entity_id and entity_type:
-                    signal_sender = get_signal_sender()
-                    
                     verification_data = {
                         "approved": True,
                         "property_details": record.payload.get("property_details", {}),
                         "documents": record.payload.get("documents", []),
                     }
-                    
-                    # Send signal in a separate thread to avoid event loop conflicts
-                    # This is necessary because this code may be called from within
-                    # a Temporal activity which already has an event loop running
-                    def _send_signal():
-                        """Run signal sending in a new event loop."""
-                        new_loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(new_loop)
-                        try:
-                            return new_loop.run_until_complete(
-                                signal_sender.send_document_verified_signal(
-                                    entity_id=entity_id,
-                                    entity_type=entity_type,
-                                    verification_data=verification_data,
-                                )
-                            )
-                        finally:
-                            new_loop.close()
-                    
-                    # Execute in thread pool to avoid blocking
-                    with ThreadPoolExecutor(max_workers=1) as executor:
-                        future = executor.submit(_send_signal)
-                        success = future.result(timeout=30)  # 30 second timeout
-                    
-                    if success:
-                        self._logger.info(
-                            "document_verified_signal_sent_success",
-                            extra={
-                                "entity_id": entity_id,
-                                "entity_type": entity_type,
-                                "event_id": record.event_id,
-                            },
-                        )
-                    else:
-                        self._logger.warning(
-                            "document_verified_signal_send_failed",
-                            extra={
-                                "entity_id": entity_id,
-                                "entity_type": entity_type,
-                                "event_id": record.event_id,
-                            },
-                        )
+
+                    # Sent from the background loop; the outcome is logged there so
+                    # ingest does not wait on the Temporal round trip.
+                    get_signal_dispatcher().enqueue(
+                        entity_id=entity_id,
+                        entity_type=entity_type,
+                        verification_data=verification_data,
+                        event_id=record.event_id,
+                    )
             except Exception:  # noqa: BLE001
                 self._logger.exception(
                     "document_verified_signal_dispatch_failed",
                     extra={"event_id": record.event_id},
                 )
-        
-        # Handle property.activated events to update entity status
-        if record.event_type == "property.activated":
+
+    def _apply_property_activations(self, records: Sequence[PlatformEvent]) -> None:
+        """Mark activated properties as tokenized and audit each change.
+
+        Each property gets a single UPDATE ... RETURNING that merges the new keys
+        into ``attributes`` server-side, so nothing is read before writing; the
+        audit INSERTs are flushed together and the caller's commit covers both.
+        All writes run in a savepoint, so a failure rolls back every UPDATE and
+        audit row of the handler while the ingested events are still committed.
+        """
+
+        activations: List[Tuple[PlatformEvent, UUID, Optional[UUID]]] = []
+        for record in records:
+            if not record.payload.get("property_id"):
+                continue
+            owner_id = record.payload.get("owner_id")
             try:
-                from app.services.entities import EntityService
-                from app.services.audit import AuditService
-                from uuid import UUID
-                from sqlalchemy.orm.attributes import flag_modified
-                
-                property_id = record.payload.get("property_id")
-                
-                if property_id:
-                    # Update property status to tokenized
-                    entity_service = EntityService(self._session)
-                    entity = entity_service.get(UUID(property_id))
-                    
-                    if entity:
-                        # Update attributes
-                        entity.attributes["property_status"] = "active"
-                        entity.attributes["tokenized_at"] = record.occurred_at.isoformat()
-                        entity.attributes["smart_contract_address"] = record.payload.get("contract_address")
-                        entity.attributes["total_tokens"] = record.payload.get("total_tokens")
-                        
-                        # Mark attributes as modified so SQLAlchemy detects the change
-                        flag_modified(entity, "attributes")
-                        
-                        self._session.add(entity)
-                        self._session.flush()
-                        
-                        # Create audit log
-                        audit_service = AuditService(self._session)
-                        audit_service.record(
-                            action="property.tokenized",
-                            actor_id=UUID(record.payload.get("owner_id")) if record.payload.get("owner_id") else None,
-                            entity_id=UUID(property_id),
-                            entity_type=entity.type.value,
-                            details={
-                                "property_status": {"old": "pending", "new": "active"},
-                                "smart_contract_address": record.payload.get("contract_address"),
-                                "total_tokens": record.payload.get("total_tokens"),
-                                "workflow_event_id": record.event_id,
-                                "tokenized_at": record.occurred_at.isoformat(),
-                            },
-                        )
-                        
-                        self._session.commit()
-                        
-                        self._logger.info(
-                            "property_status_updated_to_tokenized",
-                            extra={
-                                "property_id": property_id,
-                                "event_id": record.event_id,
-                                "contract_address": record.payload.get("contract_address"),
-                            },
-                        )
-            except Exception:  # noqa: BLE001
-                self._logger.exception(
-                    "property_activated_handler_failed",
+                activations.append(
+                    (record, UUID(str(record.payload["property_id"])), UUID(str(owner_id)) if owner_id else None)
+                )
+            except ValueError:
+                self._logger.warning(
+                    "property_activated_invalid_payload",
                     extra={"event_id": record.event_id},
                 )
+        if not activations:
+            return
 
-        return record
+        try:
+            with self._session.begin_nested():
+                audit_events = self._tokenize_properties(activations)
+                if audit_events:
+                    AuditService(self._session).record_events(audit_events)
+        except Exception:  # noqa: BLE001
+            self._logger.exception(
+                "property_activated_handler_failed",
+                extra={"event_ids": [record.event_id for record, _, _ in activations]},
+            )
+            return
+
+        for event in audit_events:
+            self._logger.info(
+                "property_status_updated_to_tokenized",
+                extra={
+                    "property_id": str(event.entity_id),
+                    "event_id": event.details["workflow_event_id"],
+                    "contract_address": event.details["smart_contract_address"],
+                },
+            )
+
+    def _tokenize_properties(
+        self,
+        activations: Sequence[Tuple[PlatformEvent, UUID, Optional[UUID]]],
+    ) -> List[AuditEvent]:
+        audit_events: List[AuditEvent] = []
+        for record, property_id, owner_id in activations:
+            entity_type = self._session.scalar(
+                update(Entity)
+                .where(Entity.id == property_id)
+                .values(
+                    attributes=self._merged_attributes(
+                        {
+                            "property_status": "active",
+                            "tokenized_at": record.occurred_at.isoformat(),
+                            "smart_contract_address": record.payload.get("contract_address"),
+                            "total_tokens": record.payload.get("total_tokens"),
+                        }
+                    )
+                )
+                .returning(Entity.type)
+                .execution_options(synchronize_session="fetch")
+            )
+            if entity_type is None:
+                self._logger.warning(
+                    "property_activated_entity_missing",
+                    extra={"property_id": str(property_id), "event_id": record.event_id},
+                )
+                continue
+            invalidate_token_details_on_commit(self._session, property_id)
+
+            audit_events.append(
+                AuditEvent.model_construct(
+                    event_id=None,
+                    source="entity_permissions_core",
+                    action="property.tokenized",
+                    actor_id=owner_id,
+                    actor_type="user",
+                    entity_id=property_id,
+                    entity_type=entity_type.value,
+                    details={
+                        "property_status": {"old": "pending", "new": "active"},
+                        "smart_contract_address": record.payload.get("contract_address"),
+                        "total_tokens": record.payload.get("total_tokens"),
+                        "workflow_event_id": record.event_id,
+                        "tokenized_at": record.occurred_at.isoformat(),
+                    },
+                    correlation_id=None,
+                    occurred_at=datetime.now(timezone.utc),
+                )
+            )
+        return audit_events
+
+    # event_type -> handler called once per ingest with every new event of that type.
+    _EVENT_HANDLERS: Dict[str, Callable[["EventService", Sequence[PlatformEvent]], None]] = {
+        "document.verified": _enqueue_document_verified_signals,
+        "property.activated": _apply_property_activations,
+    }
+
+    def _merged_attributes(self, patch: Dict[str, Any]) -> ColumnElement[Any]:
+        """SQL expression setting ``patch``'s keys on ``Entity.attributes``, keeping the rest."""
+
+        if self._session.get_bind().dialect.name == "postgresql":
+            return Entity.attributes.op("||")(literal(patch, JSONType))
+        # SQLite: json_set keeps None as JSON null (json_patch would drop the key).
+        path_values: List[Any] = []
+        for key, value in patch.items():
+            path_values.extend((f"$.{key}", value))
+        return func.json_set(Entity.attributes, *path_values)
 
     def list_events(
         self,
@@ -224,16 +351,13 @@ class EventService:
         event_type: Optional[str] = None,
         source: Optional[str] = None,
         limit: int = 50,
-    ) -> List[PlatformEvent]:
-        stmt = select(PlatformEvent).order_by(PlatformEvent.occurred_at.desc()).limit(limit)
-        if event_type:
-            stmt = stmt.where(PlatformEvent.event_type == event_type)
-        if source:
-            stmt = stmt.where(PlatformEvent.source == source)
-        return list(self._session.scalars(stmt))
+    ) -> Sequence[PlatformEvent]:
+        stmt = _LIST_STATEMENTS[(bool(event_type), bool(source))]
+        params = {"event_type": event_type, "source": source, "limit": limit}
+        return self._session.scalars(stmt, params).all()
 
     def get_event(self, event_id: str) -> PlatformEvent:
-        record = self._session.scalar(select(PlatformEvent).where(PlatformEvent.event_id == event_id))
+        record = self._session.scalar(_GET_EVENT_STATEMENT, {"event_id": event_id})
         if not record:
             raise EventNotFoundError(f"Event {event_id} not found")
         return record
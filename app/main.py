@@ -5,26 +5,43 @@ from __future__ import annotations
 from contextlib import asynccontextmanager
 import sys
 
+import anyio.to_thread
 import python_multipart
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 from app.api.error_handlers import register_exception_handlers
 from app.api.routers import get_api_router
 from app.core.config import AppSettings, get_settings
 from app.core.database import session_scope
 from app.core.logging import configure_logging
-from app.services.roles import RoleService
+from app.services.roles import RoleService, warm_role_id_cache
 
 # Starlette <0.39 still imports `multipart`; map it to python-multipart to avoid warnings.
 sys.modules.setdefault("multipart", python_multipart)
 
 
+def _threadpool_limit(settings: AppSettings) -> int | None:
+    """Size of the worker pool sync routes run on; ``None`` keeps the anyio default."""
+
+    if settings.threadpool_workers is not None:
+        return settings.threadpool_workers
+    if settings.database_url.startswith("sqlite"):
+        return None
+    # Threads beyond the connection pool would only queue on checkout while holding a worker.
+    return settings.database_pool_size + settings.database_max_overflow
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):  # noqa: D401
     """Application lifespan context for startup/shutdown hooks."""
 
     settings = get_settings()
+
+    limit = _threadpool_limit(settings)
+    if limit is not None:
+        anyio.to_thread.current_default_thread_limiter().total_tokens = limit
     
     # Safety check: Never run database operations in test environment
     # Tests should use in-memory databases and handle setup themselves
@@ -34,6 +51,7 @@ async def lifespan(app: FastAPI):  # noqa: D401
     
     with session_scope() as session:
         RoleService(session).ensure_baseline_permissions(settings.default_permissions)
+        warm_role_id_cache(session)
 
     yield
 
@@ -48,6 +66,7 @@ def create_app(settings: AppSettings | None = None) -> FastAPI:
         title="Omen Entity & Permissions Core",
         version="1.0.0",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     register_exception_handlers(app)
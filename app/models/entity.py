@@ -36,6 +36,12 @@ class Entity(TimestampMixin, Base):
     __table_args__ = (
         Index("ix_entities_type", "type"),
         Index("ix_entities_parent", "parent_id"),
+        Index(
+            "ix_entities_attributes",
+            "attributes",
+            postgresql_using="gin",
+            postgresql_ops={"attributes": "jsonb_path_ops"},
+        ).ddl_if(dialect="postgresql"),
         UniqueConstraint("name", "type", name="uq_entities_name_type"),
     )
 
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import List
+from functools import lru_cache
+from typing import Tuple
 
 # Document permissions (existing)
 DOCUMENT_UPLOAD = "document:upload"
@@ -29,9 +30,10 @@ USER_APPROVE = "user:approve"
 USER_MANAGE = "user:manage"
 
 
-def get_all_permissions() -> List[str]:
-    """Return list of all permission actions."""
-    return [
+@lru_cache(maxsize=1)
+def get_all_permissions() -> Tuple[str, ...]:
+    """Return all permission actions."""
+    return (
         # Document permissions
         DOCUMENT_UPLOAD,
         DOCUMENT_VERIFY,
@@ -52,12 +54,13 @@ def get_all_permissions() -> List[str]:
         USER_ONBOARD,
         USER_APPROVE,
         USER_MANAGE,
-    ]
+    )
 
 
-def get_agent_permissions() -> List[str]:
+@lru_cache(maxsize=1)
+def get_agent_permissions() -> Tuple[str, ...]:
     """Return permissions for Agent role."""
-    return [
+    return (
         DOCUMENT_UPLOAD,
         DOCUMENT_VERIFY,
         DOCUMENT_DOWNLOAD,
@@ -71,40 +74,43 @@ def get_agent_permissions() -> List[str]:
         USER_ONBOARD,
         USER_APPROVE,
         USER_MANAGE,
-    ]
+    )
 
 
-def get_property_owner_permissions() -> List[str]:
+@lru_cache(maxsize=1)
+def get_property_owner_permissions() -> Tuple[str, ...]:
     """Return permissions for Property Owner role."""
-    return [
+    return (
         DOCUMENT_UPLOAD,
         DOCUMENT_DOWNLOAD,
         PROPERTY_CREATE,
         PROPERTY_VIEW,
         PROPERTY_UPDATE,
         TOKEN_VIEW,
-    ]
+    )
 
 
-def get_investor_pending_permissions() -> List[str]:
+@lru_cache(maxsize=1)
+def get_investor_pending_permissions() -> Tuple[str, ...]:
     """Return permissions for Investor (Pending) role."""
-    return [
+    return (
         DOCUMENT_UPLOAD,
         DOCUMENT_DOWNLOAD,
         PROPERTY_VIEW,
         TOKEN_VIEW,
-    ]
+    )
 
 
-def get_investor_active_permissions() -> List[str]:
+@lru_cache(maxsize=1)
+def get_investor_active_permissions() -> Tuple[str, ...]:
     """Return permissions for Investor (Active) role."""
-    return [
+    return (
         DOCUMENT_UPLOAD,
         DOCUMENT_DOWNLOAD,
         PROPERTY_VIEW,
         TOKEN_VIEW,
         TOKEN_TRADE,
-    ]
+    )
 
 
 
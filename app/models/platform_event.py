@@ -8,7 +8,7 @@ from enum import Enum
 from typing import Optional
 
 from sqlalchemy import Enum as SqlEnum
-from sqlalchemy import Index, Integer, String
+from sqlalchemy import Index, Integer, String, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models.base import Base, TimestampMixin
@@ -28,8 +28,19 @@ class PlatformEvent(TimestampMixin, Base):
 
     __tablename__ = "platform_events"
     __table_args__ = (
-        Index("ix_platform_events_event_type", "event_type"),
+        # list_events filters on event_type and/or source and orders by occurred_at DESC;
+        # these serve the filter and the ordering together, so LIMIT stops early.
+        Index("ix_platform_events_type_occurred_at", "event_type", "occurred_at"),
+        Index("ix_platform_events_source_occurred_at", "source", "occurred_at"),
         Index("ix_platform_events_occurred_at", "occurred_at"),
+        # Partial: only rows with a correlation_id take part in ingest deduplication.
+        Index(
+            "ix_platform_events_source_correlation",
+            "source",
+            "correlation_id",
+            postgresql_where=text("correlation_id IS NOT NULL"),
+            sqlite_where=text("correlation_id IS NOT NULL"),
+        ),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(GUID(), primary_key=True, default=uuid.uuid4)
@@ -45,7 +56,7 @@ class PlatformEvent(TimestampMixin, Base):
         SqlEnum(
             DeliveryState,
             name="platform_event_delivery_state",
-            native_enum=False,
+            native_enum=True,
             values_callable=lambda enum: [state.value for state in enum],
         ),
         nullable=False,
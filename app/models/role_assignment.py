@@ -18,7 +18,7 @@ class RoleAssignment(TimestampMixin, Base):
 
     __tablename__ = "role_assignments"
     __table_args__ = (
-        Index("ix_role_assignments_principal", "principal_id"),
+        Index("ix_role_assignments_principal_entity", "principal_id", "entity_id"),
         Index("ix_role_assignments_entity", "entity_id"),
         Index("ix_role_assignments_role", "role_id"),
         UniqueConstraint("principal_id", "principal_type", "role_id", "entity_id", name="uq_role_assignments_principal_role_entity"),
@@ -23,9 +23,12 @@ class GUID(TypeDecorator):
     def process_bind_param(self, value: Any, dialect):
         if value is None:
             return value
-        if isinstance(value, uuid.UUID):
-            return str(value)
-        return str(uuid.UUID(str(value)))
+        if not isinstance(value, uuid.UUID):
+            value = uuid.UUID(str(value))
+        if dialect.name == "postgresql":
+            # Native uuid column: hand the driver the UUID object, not 36 chars of text.
+            return value
+        return str(value)
 
     def process_result_value(self, value: Any, dialect):
         if value is None:
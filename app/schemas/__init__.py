@@ -6,7 +6,7 @@ from app.schemas.assignment import (
 )
 from app.schemas.authorization import AuthorizationRequest, AuthorizationResponse
 from app.schemas.entity import EntityCreate, EntityResponse, EntityUpdate
-from app.schemas.event import EventIngestRequest, EventResponse
+from app.schemas.event import EventIngestBatchRequest, EventIngestRequest, EventResponse
 from app.schemas.permission import PermissionCreate, PermissionResponse
 from app.schemas.role import RoleCreate, RoleResponse, RoleUpdate
 
@@ -23,6 +23,7 @@ __all__ = [
     "RoleUpdate",
     "RoleAssignmentCreate",
     "RoleAssignmentResponse",
+    "EventIngestBatchRequest",
     "EventIngestRequest",
     "EventResponse",
 ]
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
@@ -35,6 +35,12 @@ class EventIngestRequest(BaseModel):
         return value.astimezone(timezone.utc)
 
 
+class EventIngestBatchRequest(BaseModel):
+    """Several events ingested with shared deduplication lookups and writes."""
+
+    events: List[EventIngestRequest] = Field(..., min_length=1, max_length=500)
+
+
 class EventResponse(BaseModel):
     """API response describing a stored platform event."""
 
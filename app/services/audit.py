@@ -6,9 +6,10 @@ import hashlib
 import json
 import logging
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Sequence
 from uuid import UUID
 
+import orjson
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
@@ -16,7 +17,8 @@ from app.models.audit_log import AuditLog
 from app.schemas.audit import AuditEvent
 
 
-HASH_VERSION = 1
+HASH_VERSION = 2
+LEGACY_HASH_VERSION = 1
 GENESIS_HASH = "0" * 64
 
 
@@ -50,7 +52,11 @@ def canonicalize_audit_entry_payload(
     occurred_at: datetime,
     previous_hash: str,
 ) -> str:
-    """Return the canonical JSON string used for audit chain hashing."""
+    """Return the canonical JSON string used for audit chain hashing.
+
+    Version 1 entries were canonicalized with the stdlib ``json`` module and keep
+    that encoding so existing chains still verify; newer versions use orjson.
+    """
 
     payload = {
         "sequence": sequence,
@@ -67,13 +73,21 @@ def canonicalize_audit_entry_payload(
         "occurred_at": _normalize_timestamp(occurred_at).isoformat(),
         "previous_hash": previous_hash,
     }
-    return json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    if hash_version == LEGACY_HASH_VERSION:
+        return json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return orjson.dumps(
+        payload,
+        default=str,
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+    ).decode("utf-8")
 
 
 def compute_audit_entry_hash(previous_hash: str, canonical_payload: str) -> str:
     """Derive the SHA256 hash that anchors the audit chain."""
 
-    return hashlib.sha256((previous_hash + canonical_payload).encode("utf-8")).hexdigest()
+    digest = hashlib.sha256(previous_hash.encode("utf-8"))
+    digest.update(canonical_payload.encode("utf-8"))
+    return digest.hexdigest()
 
 
 class AuditService:
@@ -99,7 +113,9 @@ class AuditService:
     ) -> AuditLog:
         """Write an audit log entry anchored into the hash chain."""
 
-        event = AuditEvent(
+        # Arguments come from internal callers, so skip pydantic validation (and the
+        # copy of ``details`` it makes); only the timestamp needs normalizing.
+        event = AuditEvent.model_construct(
             event_id=event_id,
             source=source,
             action=action,
@@ -109,7 +125,7 @@ class AuditService:
             entity_type=entity_type,
             details=details or {},
             correlation_id=correlation_id,
-            occurred_at=occurred_at or datetime.now(timezone.utc),
+            occurred_at=_normalize_timestamp(occurred_at) if occurred_at else datetime.now(timezone.utc),
         )
         return self.record_event(event)
 
@@ -123,10 +139,66 @@ class AuditService:
                 return existing
 
         previous_sequence, previous_hash = self._lock_chain_tip()
-        next_sequence = previous_sequence + 1
+        audit_entry = self._build_entry(event, event_id_str, previous_sequence + 1, previous_hash)
+
+        self._session.add(audit_entry)
+        self._session.flush()
+
+        self._log_entry(audit_entry)
+        return audit_entry
+
+    def record_events(self, events: Sequence[AuditEvent]) -> List[AuditLog]:
+        """Append a batch of events to the chain with one dedup query and one flush.
+
+        Returns an entry per input event, in order; events already recorded (or
+        repeated within the batch) resolve to the existing entry.
+        """
+
+        event_ids = {str(event.event_id) for event in events if event.event_id}
+        existing: Dict[str, AuditLog] = {}
+        if event_ids:
+            existing = {
+                entry.event_id: entry
+                for entry in self._session.scalars(select(AuditLog).where(AuditLog.event_id.in_(event_ids)))
+            }
 
+        sequence, previous_hash = self._lock_chain_tip()
+        entries: List[AuditLog] = []
+        created: List[AuditLog] = []
+        for event in events:
+            event_id_str = str(event.event_id) if event.event_id else None
+            if event_id_str and event_id_str in existing:
+                entries.append(existing[event_id_str])
+                continue
+            sequence += 1
+            audit_entry = self._build_entry(event, event_id_str, sequence, previous_hash)
+            previous_hash = audit_entry.entry_hash
+            if event_id_str:
+                existing[event_id_str] = audit_entry
+            entries.append(audit_entry)
+            created.append(audit_entry)
+
+        if created:
+            # Client-side timestamps (one per batch) leave the INSERT with no server
+            # defaults to RETURN, so the rows go out as a plain multi-row insert.
+            now = datetime.now(timezone.utc)
+            for audit_entry in created:
+                audit_entry.created_at = audit_entry.updated_at = now
+            self._session.add_all(created)
+            self._session.flush()
+            for audit_entry in created:
+                self._log_entry(audit_entry)
+        return entries
+
+    @staticmethod
+    def _build_entry(
+        event: AuditEvent,
+        event_id_str: Optional[str],
+        sequence: int,
+        previous_hash: str,
+    ) -> AuditLog:
         canonical_payload = canonicalize_audit_entry_payload(
-            sequence=next_sequence,
+            sequence=sequence,
             hash_version=HASH_VERSION,
             event_id=event_id_str,
             source=event.source,
@@ -141,12 +213,10 @@ class AuditService:
             previous_hash=previous_hash,
         )
 
-        entry_hash = compute_audit_entry_hash(previous_hash, canonical_payload)
-
-        audit_entry = AuditLog(
-            sequence=next_sequence,
+        return AuditLog(
+            sequence=sequence,
             previous_hash=previous_hash,
-            entry_hash=entry_hash,
+            entry_hash=compute_audit_entry_hash(previous_hash, canonical_payload),
             hash_version=HASH_VERSION,
             event_id=event_id_str,
             source=event.source,
@@ -160,24 +230,21 @@ class AuditService:
             details=event.details,
         )
 
-        self._session.add(audit_entry)
-        self._session.flush()
-
+    def _log_entry(self, audit_entry: AuditLog) -> None:
         self._logger.info(
             "audit_event",
             extra={
-                "sequence": next_sequence,
-                "entry_hash": entry_hash,
-                "previous_hash": previous_hash,
-                "action": event.action,
-                "actor_id": to_optional_str(event.actor_id),
-                "entity_id": to_optional_str(event.entity_id),
-                "entity_type": event.entity_type,
-                "source": event.source,
-                "event_id": event_id_str,
+                "sequence": audit_entry.sequence,
+                "entry_hash": audit_entry.entry_hash,
+                "previous_hash": audit_entry.previous_hash,
+                "action": audit_entry.action,
+                "actor_id": to_optional_str(audit_entry.actor_id),
+                "entity_id": to_optional_str(audit_entry.entity_id),
+                "entity_type": audit_entry.entity_type,
+                "source": audit_entry.source,
+                "event_id": audit_entry.event_id,
             },
         )
-        return audit_entry
 
     def _lock_chain_tip(self) -> tuple[int, str]:
         stmt = select(AuditLog.sequence, AuditLog.entry_hash).order_by(AuditLog.sequence.desc()).limit(1)
@@ -15,6 +15,9 @@ from app.services.audit import (
 )
 
 
+VERIFY_BATCH_SIZE = 1000
+
+
 class AuditVerificationError(RuntimeError):
     """Raised when audit chain verification fails."""
 
@@ -46,24 +49,18 @@ class AuditVerifier:
         if end_sequence is not None:
             query = query.where(AuditLog.sequence <= end_sequence)
 
-        entries = list(self._session.execute(query).scalars())
-        if not entries:
-            return VerificationResult(checked=0, start_sequence=start_sequence or 0, end_sequence=end_sequence or 0)
+        entries = self._session.execute(query.execution_options(yield_per=VERIFY_BATCH_SIZE)).scalars()
 
         previous_hash = GENESIS_HASH
-        previous_sequence = entries[0].sequence - 1
-
-        if start_sequence and start_sequence > 1:
-            previous_entry = self._session.scalar(
-                select(AuditLog).where(AuditLog.sequence == start_sequence - 1)
-            )
-            if not previous_entry:
-                raise AuditVerificationError(f"Missing audit entry for sequence {start_sequence - 1}")
-            previous_hash = previous_entry.entry_hash
-            previous_sequence = start_sequence - 1
-
+        previous_sequence: int | None = None
+        first_sequence: int | None = None
+        last_sequence = 0
         checked = 0
         for entry in entries:
+            if previous_sequence is None:
+                first_sequence = entry.sequence
+                previous_hash, previous_sequence = self._resolve_anchor(start_sequence, entry.sequence)
+
             expected = previous_sequence + 1
             if entry.sequence != expected:
                 raise AuditVerificationError(
@@ -95,10 +92,26 @@ class AuditVerifier:
 
             previous_hash = entry.entry_hash
             previous_sequence = entry.sequence
+            last_sequence = entry.sequence
             checked += 1
 
+        if first_sequence is None:
+            return VerificationResult(checked=0, start_sequence=start_sequence or 0, end_sequence=end_sequence or 0)
+
         return VerificationResult(
             checked=checked,
-            start_sequence=entries[0].sequence,
-            end_sequence=entries[-1].sequence,
+            start_sequence=first_sequence,
+            end_sequence=last_sequence,
         )
+
+    def _resolve_anchor(self, start_sequence: int | None, first_sequence: int) -> tuple[str, int]:
+        """Return the hash and sequence the first verified entry must chain from."""
+
+        if start_sequence and start_sequence > 1:
+            previous_entry = self._session.scalar(
+                select(AuditLog).where(AuditLog.sequence == start_sequence - 1)
+            )
+            if not previous_entry:
+                raise AuditVerificationError(f"Missing audit entry for sequence {start_sequence - 1}")
+            return previous_entry.entry_hash, start_sequence - 1
+        return GENESIS_HASH, first_sequence - 1
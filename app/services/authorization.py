@@ -50,9 +50,6 @@ class AuthorizationService:
             )
             raise EntityNotFoundError(f"Entity {payload.resource_id} not found")
 
-        lineage_ids = self._collect_entity_lineage_ids(entity.id)
-        now = datetime.now(tz=timezone.utc)
-
         cache_key: PermissionCacheKey = (
             str(payload.user_id),
             payload.principal_type,
@@ -72,6 +69,8 @@ class AuthorizationService:
             )
             return cached
 
+        lineage_ids = self._collect_entity_lineage_ids(entity)
+        now = datetime.now(tz=timezone.utc)
         stmt = (
             select(RoleAssignment, Role)
             .join(Role, RoleAssignment.role_id == Role.id)
@@ -131,17 +130,15 @@ class AuthorizationService:
         self._cache.set(cache_key, authorized, principal_id=str(payload.user_id))
         return authorized
 
-    def _collect_entity_lineage_ids(self, entity_id: UUID) -> List[UUID]:
-        lineage: List[UUID] = [entity_id]
-        visited = {entity_id}
-        current_id = entity_id
-        while True:
-            parent_id = self._session.scalar(
-                select(Entity.parent_id).where(Entity.id == current_id)
-            )
-            if not parent_id or parent_id in visited:
-                break
+    def _collect_entity_lineage_ids(self, entity: Entity) -> List[UUID]:
+        # The target entity is already loaded, so start the walk from its parent.
+        lineage: List[UUID] = [entity.id]
+        visited = {entity.id}
+        parent_id = entity.parent_id
+        while parent_id and parent_id not in visited:
             lineage.append(parent_id)
             visited.add(parent_id)
-            current_id = parent_id
+            parent_id = self._session.scalar(
+                select(Entity.parent_id).where(Entity.id == parent_id)
+            )
         return lineage
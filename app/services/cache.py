@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from threading import RLock
-from typing import Dict, Optional, Protocol, Sequence, Set, Tuple, cast
+from typing import Dict, List, Optional, Protocol, Sequence, Set, Tuple, cast
 
 import httpx
 
@@ -83,14 +83,15 @@ class RedisPermissionCache(PermissionCache):
     def set(self, key: PermissionCacheKey, value: bool, *, principal_id: str) -> None:
         cache_key = self._perm_key(key)
         value_str = "1" if value else "0"
-        self._execute("SET", cache_key, value_str, "PX", str(self._ttl_ms))
-
         index_key = self._principal_index_key(principal_id)
         ttl_seconds = str(max(self._ttl_ms // 1000, 1))
-        self._execute("SADD", index_key, cache_key)
-        self._execute("EXPIRE", index_key, ttl_seconds)
-        self._execute("SADD", self._registry_key, principal_id)
-        self._execute("EXPIRE", self._registry_key, ttl_seconds)
+        self._pipeline(
+            ["SET", cache_key, value_str, "PX", str(self._ttl_ms)],
+            ["SADD", index_key, cache_key],
+            ["EXPIRE", index_key, ttl_seconds],
+            ["SADD", self._registry_key, principal_id],
+            ["EXPIRE", self._registry_key, ttl_seconds],
+        )
 
     def invalidate(self) -> None:
         principals = cast(Sequence[str], self._execute("SMEMBERS", self._registry_key) or [])
@@ -102,11 +103,10 @@ class RedisPermissionCache(PermissionCache):
     def invalidate_for_principal(self, principal_id: str) -> None:
         index_key = self._principal_index_key(principal_id)
         keys = list(cast(Sequence[str], self._execute("SMEMBERS", index_key) or []))
-        if keys:
-            self._execute("DEL", index_key, *keys)
-        else:
-            self._execute("DEL", index_key)
-        self._execute("SREM", self._registry_key, principal_id)
+        self._pipeline(
+            ["DEL", index_key, *keys],
+            ["SREM", self._registry_key, principal_id],
+        )
 
     def _perm_key(self, key: PermissionCacheKey) -> str:
         principal_id, principal_type, resource_id, action = key
@@ -121,6 +121,17 @@ class RedisPermissionCache(PermissionCache):
         payload = response.json()
         return payload.get("result")
 
+    def _pipeline(self, *commands: Sequence[str]) -> List[Optional[object]]:
+        """Send several commands in one round trip via the Upstash pipeline endpoint."""
+        response = self._client.post("/pipeline", json=[list(command) for command in commands])
+        response.raise_for_status()
+        results: List[Optional[object]] = []
+        for item in response.json():
+            if "error" in item:
+                raise RuntimeError(f"Redis pipeline command failed: {item['error']}")
+            results.append(item.get("result"))
+        return results
+
 
 _shared_cache: Optional[PermissionCache] = None
 
@@ -11,9 +11,10 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.events_engine import EventDispatcher, get_event_dispatcher
-from app.models.entity import Entity, EntityStatus
+from app.models.entity import Entity, EntityStatus, EntityType
 from app.schemas.entity import EntityCreate, EntityUpdate
 from app.services.audit import AuditService
+from app.services.token_registry import invalidate_token_details_on_commit
 
 
 class EntityNotFoundError(ValueError):
@@ -97,6 +98,8 @@ class EntityService:
 
         self._session.add(entity)
         self._session.flush()
+        if entity.type == EntityType.OFFERING:
+            invalidate_token_details_on_commit(self._session, entity.id)
 
         self._audit.record(
             action="entity.update",
@@ -3,15 +3,18 @@
 from __future__ import annotations
 
 import logging
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import func, select, type_coerce
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import ColumnElement
 
 from app.models.entity import Entity, EntityStatus, EntityType
 from app.schemas.property import PropertyCreate, PropertyUpdate
 from app.services.audit import AuditService
+from app.services.token_registry import invalidate_token_details_on_commit
 
 logger = logging.getLogger("app.services.properties")
 
@@ -140,26 +143,47 @@ class PropertyService:
         Returns:
             List of property entities
         """
-        stmt = select(Entity).where(Entity.type == EntityType.OFFERING)
-        stmt = stmt.where(Entity.status != EntityStatus.ARCHIVED)
-        
-        if owner_id:
-            stmt = stmt.where(Entity.parent_id == owner_id)
-        
-        stmt = stmt.order_by(Entity.created_at.desc()).limit(limit).offset(offset)
-        
-        results = self._session.scalars(stmt).all()
+        stmt = (
+            select(Entity)
+            .where(*self._property_filters(status=status, property_type=property_type, owner_id=owner_id))
+            .order_by(Entity.created_at.desc())
+            .limit(limit)
+            .offset(offset)
+        )
+        return list(self._session.scalars(stmt).all())
+    
+    def list_properties_with_total(
+        self,
+        *,
+        status: Optional[str] = None,
+        property_type: Optional[str] = None,
+        owner_id: Optional[UUID] = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> Tuple[List[Entity], int]:
+        """
+        List a page of properties together with the unpaginated match count.
         
-        # Filter by attributes in Python (database-agnostic approach)
-        filtered_results = []
-        for entity in results:
-            if status and entity.attributes.get("property_status") != status:
-                continue
-            if property_type and entity.attributes.get("property_type") != property_type:
-                continue
-            filtered_results.append(entity)
+        The count is computed with a ``COUNT(*) OVER ()`` window in the same
+        query, so a page costs one roundtrip instead of two.
         
-        return filtered_results
+        Returns:
+            Tuple of (property entities, total matching properties)
+        """
+        stmt = (
+            select(Entity, func.count().over().label("total"))
+            .where(*self._property_filters(status=status, property_type=property_type, owner_id=owner_id))
+            .order_by(Entity.created_at.desc())
+            .limit(limit)
+            .offset(offset)
+        )
+        rows = self._session.execute(stmt).all()
+        if rows:
+            return [row[0] for row in rows], int(rows[0].total)
+        if offset:
+            # Past the last page there is no row to carry the window count.
+            return [], self.get_property_count(status=status, property_type=property_type, owner_id=owner_id)
+        return [], 0
     
     def update_property(
         self,
@@ -206,6 +230,7 @@ class PropertyService:
         
         self._session.add(property_entity)
         self._session.flush()
+        invalidate_token_details_on_commit(self._session, property_entity.id)
         
         self._audit.record(
             action="property.update",
@@ -235,24 +260,50 @@ class PropertyService:
         Returns:
             Total count
         """
-        stmt = select(Entity).where(Entity.type == EntityType.OFFERING)
-        stmt = stmt.where(Entity.status != EntityStatus.ARCHIVED)
-        
-        if "owner_id" in filters and filters["owner_id"]:
-            stmt = stmt.where(Entity.parent_id == filters["owner_id"])
-        
-        results = self._session.scalars(stmt).all()
-        
-        # Filter by attributes in Python (database-agnostic approach)
-        count = 0
-        for entity in results:
-            if "status" in filters and filters["status"]:
-                if entity.attributes.get("property_status") != filters["status"]:
-                    continue
-            if "property_type" in filters and filters["property_type"]:
-                if entity.attributes.get("property_type") != filters["property_type"]:
-                    continue
-            count += 1
-        
-        return count
+        stmt = (
+            select(func.count())
+            .select_from(Entity)
+            .where(
+                *self._property_filters(
+                    status=filters.get("status"),
+                    property_type=filters.get("property_type"),
+                    owner_id=filters.get("owner_id"),
+                )
+            )
+        )
+        return int(self._session.scalar(stmt) or 0)
+
+    def _property_filters(
+        self,
+        *,
+        status: Optional[str],
+        property_type: Optional[str],
+        owner_id: Optional[UUID],
+    ) -> List[ColumnElement[bool]]:
+        """Build WHERE clauses shared by the property list and count queries."""
+        clauses: List[ColumnElement[bool]] = [
+            Entity.type == EntityType.OFFERING,
+            Entity.status != EntityStatus.ARCHIVED,
+        ]
+        if owner_id:
+            clauses.append(Entity.parent_id == owner_id)
+
+        attribute_filters: Dict[str, Any] = {}
+        if status:
+            attribute_filters["property_status"] = status
+        if property_type:
+            attribute_filters["property_type"] = property_type
+        if not attribute_filters:
+            return clauses
+
+        if self._session.get_bind().dialect.name == "postgresql":
+            # Containment is served by the GIN index on entities.attributes.
+            clauses.append(
+                Entity.attributes.op("@>", is_comparison=True)(type_coerce(attribute_filters, JSONB))
+            )
+        else:
+            clauses.extend(
+                Entity.attributes[key].as_string() == value for key, value in attribute_filters.items()
+            )
+        return clauses
 
@@ -4,12 +4,13 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime, timezone
-from typing import Iterable, List, Optional
+from threading import Lock
+from typing import Dict, Iterable, List, Optional, Sequence
 from uuid import UUID
 
 from sqlalchemy import and_, or_, select
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 from app.models.entity import Entity
 from app.models.permission import Permission
@@ -37,6 +38,45 @@ class RoleConflictError(RoleServiceError):
     """Raised when attempting to create a role that already exists."""
 
 
+_role_ids_by_name: Dict[str, UUID] = {}
+_role_ids_lock = Lock()
+
+
+def get_role_id_by_name(session: Session, name: str) -> Optional[UUID]:
+    """Resolve a role name to its id, caching hits for the life of the process.
+
+    Role names are immutable (``RoleUpdate`` cannot rename) and roles are never
+    deleted, so only misses need to reach the database.
+    """
+
+    with _role_ids_lock:
+        role_id = _role_ids_by_name.get(name)
+    if role_id is not None:
+        return role_id
+
+    role_id = session.scalar(select(Role.id).where(Role.name == name))
+    if role_id is not None:
+        with _role_ids_lock:
+            _role_ids_by_name[name] = role_id
+    return role_id
+
+
+def warm_role_id_cache(session: Session) -> int:
+    """Load every role's name -> id mapping in one query; returns the number cached."""
+
+    rows = session.execute(select(Role.name, Role.id)).all()
+    with _role_ids_lock:
+        _role_ids_by_name.update({name: role_id for name, role_id in rows})
+    return len(rows)
+
+
+def clear_role_id_cache() -> None:
+    """Forget cached role ids (e.g. after the schema is recreated)."""
+
+    with _role_ids_lock:
+        _role_ids_by_name.clear()
+
+
 class RoleService:
     """Coordinates permission management and role assignments."""
 
@@ -109,7 +149,7 @@ class RoleService:
         return role
 
     def list_roles(self) -> List[Role]:
-        stmt = select(Role).order_by(Role.created_at.desc())
+        stmt = select(Role).options(selectinload(Role.permissions)).order_by(Role.created_at.desc())
         return list(self._session.scalars(stmt))
 
     def assign_role(self, payload: RoleAssignmentCreate, *, actor_id: Optional[UUID]) -> RoleAssignment:
@@ -177,14 +217,14 @@ class RoleService:
         *,
         principal_id: Optional[UUID] = None,
         entity_id: Optional[UUID] = None,
-    ) -> List[RoleAssignment]:
+    ) -> Sequence[RoleAssignment]:
         stmt = select(RoleAssignment)
         if principal_id:
             stmt = stmt.filter(RoleAssignment.principal_id == principal_id)
         if entity_id:
             stmt = stmt.filter(RoleAssignment.entity_id == entity_id)
         stmt = stmt.order_by(RoleAssignment.created_at.desc())
-        return list(self._session.scalars(stmt))
+        return self._session.scalars(stmt).all()
 
     def revoke_assignment(self, assignment_id: UUID, *, actor_id: Optional[UUID]) -> None:
         assignment = self._session.get(RoleAssignment, assignment_id)
@@ -3,16 +3,82 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict
+import time
+from threading import Lock
+from typing import Any, Dict, Optional, Set, Tuple
 from uuid import UUID
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session, SessionTransaction
 
 from app.models.entity import Entity
 
 logger = logging.getLogger("app.services.token_registry")
 
+TOKEN_DETAILS_TTL_SECONDS = 5.0
+
+_token_details: Dict[UUID, Tuple[float, Dict[str, Any]]] = {}
+_token_details_lock = Lock()
+
+
+def get_cached_token_details(property_id: UUID) -> Optional[Dict[str, Any]]:
+    """Return a copy of the cached token details for a property, if still fresh."""
+
+    with _token_details_lock:
+        entry = _token_details.get(property_id)
+    if entry is None:
+        return None
+    expires_at, details = entry
+    if expires_at <= time.monotonic():
+        return None
+    return dict(details)
+
+
+def cache_token_details(property_id: UUID, details: Dict[str, Any]) -> None:
+    with _token_details_lock:
+        _token_details[property_id] = (time.monotonic() + TOKEN_DETAILS_TTL_SECONDS, dict(details))
+
+
+def invalidate_token_details(property_id: Optional[UUID] = None) -> None:
+    """Drop cached token details for one property, or for all of them.
+
+    Only writes made in this process can invalidate; the TTL bounds how long
+    changes made by workflow workers stay invisible.
+    """
+
+    with _token_details_lock:
+        if property_id is None:
+            _token_details.clear()
+        else:
+            _token_details.pop(property_id, None)
+
+
+_PENDING_INVALIDATIONS_KEY = "token_details_pending_invalidations"
+
+
+def invalidate_token_details_on_commit(session: Session, property_id: UUID) -> None:
+    """Drop a property's cached token details once ``session`` commits.
+
+    Invalidating before the commit would let a concurrent read re-cache the old
+    row; a rollback discards the pending invalidation along with the write.
+    """
+
+    pending: Set[UUID] = session.info.setdefault(_PENDING_INVALIDATIONS_KEY, set())
+    pending.add(property_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_pending_invalidations(session: Session) -> None:
+    for property_id in session.info.pop(_PENDING_INVALIDATIONS_KEY, ()):
+        invalidate_token_details(property_id)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _discard_pending_invalidations(session: Session, transaction: SessionTransaction) -> None:
+    # Runs after after_commit, so anything still pending belongs to a rolled-back write.
+    if transaction.parent is None:
+        session.info.pop(_PENDING_INVALIDATIONS_KEY, None)
+
 
 class TokenRegistryService:
     """
@@ -79,6 +145,7 @@ class TokenRegistryService:
         
         self._session.add(property_entity)
         self._session.flush()
+        invalidate_token_details_on_commit(self._session, property_entity.id)
         
         return {
             "property_id": property_id,
@@ -182,6 +249,7 @@ class TokenRegistryService:
         self._session.add(property_entity)
         self._session.add(investor_entity)
         self._session.flush()
+        invalidate_token_details_on_commit(self._session, property_entity.id)
         
         return {
             "from_investor_id": from_investor_id,
@@ -6,10 +6,15 @@ import logging
 from typing import Dict, Any
 from uuid import UUID
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.models.entity import Entity, EntityType
-from app.services.token_registry import get_token_registry_service
+from app.services.token_registry import (
+    cache_token_details,
+    get_cached_token_details,
+    get_token_registry_service,
+)
 
 logger = logging.getLogger("app.services.tokens")
 
@@ -43,13 +48,17 @@ class TokenService:
         Raises:
             TokenNotFoundError: If property not found
         """
+        cached = get_cached_token_details(property_id)
+        if cached is not None:
+            return cached
+        
         property_entity = self._session.get(Entity, property_id)
         if not property_entity or property_entity.type != EntityType.OFFERING:
             raise TokenNotFoundError(f"Property {property_id} not found")
         
         attrs = property_entity.attributes
         
-        return {
+        details = {
             "property_id": str(property_entity.id),
             "property_name": property_entity.name,
             "total_tokens": attrs.get("total_tokens", 0),
@@ -60,6 +69,8 @@ class TokenService:
             "address": attrs.get("address", ""),
             "valuation": attrs.get("valuation", 0),
         }
+        cache_token_details(property_id, details)
+        return details
     
     async def validate_purchase(
         self,
@@ -78,8 +89,16 @@ class TokenService:
         Returns:
             Validation result with details
         """
+        # Load the investor and the property in a single round trip
+        entities = {
+            entity.id: entity
+            for entity in self._session.scalars(
+                select(Entity).where(Entity.id.in_((investor_id, property_id)))
+            )
+        }
+        
         # Check investor exists and is verified
-        investor_entity = self._session.get(Entity, investor_id)
+        investor_entity = entities.get(investor_id)
         if not investor_entity or investor_entity.type != EntityType.INVESTOR:
             return {
                 "valid": False,
@@ -94,7 +113,7 @@ class TokenService:
             }
         
         # Check property exists and is active
-        property_entity = self._session.get(Entity, property_id)
+        property_entity = entities.get(property_id)
         if not property_entity or property_entity.type != EntityType.OFFERING:
             return {
                 "valid": False,
@@ -156,6 +175,9 @@ class TokenService:
         Returns:
             Available token count
         """
+        cached = get_cached_token_details(property_id)
+        if cached is not None:
+            return cached["available_tokens"]
         return await self._token_registry.get_available_tokens(str(property_id))
 
 
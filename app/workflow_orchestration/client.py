@@ -2,21 +2,71 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
+import weakref
+from typing import Dict, Optional, Tuple
+
 from temporalio.client import Client
 
 from app.workflow_orchestration.config import TemporalConfig, get_temporal_config
 
+_ClientKey = Tuple[Optional[str], Optional[str], Optional[str], bool]
+
+
+class _LoopClients:
+    """Clients connected on one event loop, plus the lock serializing their creation."""
+
+    def __init__(self) -> None:
+        self.lock = asyncio.Lock()
+        self.clients: Dict[_ClientKey, Client] = {}
+
+
+# A client is bound to the loop it connected on (uvicorn's loop, the background loop
+# in ``loop.py``, a worker's loop), so clients and locks are kept per loop; entries go
+# away with their loop.
+_loop_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopClients]" = weakref.WeakKeyDictionary()
+_loop_clients_lock = threading.Lock()
+
+
+def _client_key(config: TemporalConfig) -> _ClientKey:
+    return (config.host, config.namespace, config.api_key, config.tls_enabled)
+
+
+def _clients_for_running_loop() -> _LoopClients:
+    loop = asyncio.get_running_loop()
+    with _loop_clients_lock:
+        entry = _loop_clients.get(loop)
+        if entry is None:
+            entry = _loop_clients[loop] = _LoopClients()
+    return entry
+
 
 async def get_temporal_client(config: TemporalConfig | None = None) -> Client:
-    """Create a Temporal client using service configuration."""
+    """Return a Temporal client for the configuration, connecting once per event loop.
+
+    Clients are safe to share between coroutines on the same loop, so every caller
+    with the same connection settings on that loop reuses one gRPC channel.
+    """
 
     config = config or get_temporal_config()
     if not config.enabled:
         raise RuntimeError("Temporal service is not configured")
 
-    return await Client.connect(
-        config.host,
-        namespace=config.namespace,
-        api_key=config.api_key,
-        tls=config.tls_enabled,
-    )
+    key = _client_key(config)
+    entry = _clients_for_running_loop()
+    client = entry.clients.get(key)
+    if client is not None:
+        return client
+
+    async with entry.lock:
+        client = entry.clients.get(key)
+        if client is None:
+            client = await Client.connect(
+                config.host,
+                namespace=config.namespace,
+                api_key=config.api_key,
+                tls=config.tls_enabled,
+            )
+            entry.clients[key] = client
+    return client
@@ -0,0 +1,81 @@
+"""Long-lived event loop for calling Temporal from synchronous code."""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import concurrent.futures
+import threading
+from typing import Any, Callable, Coroutine, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+_shutdown_callbacks: List[Callable[[], None]] = []
+
+
+def get_background_loop() -> asyncio.AbstractEventLoop:
+    """Return the process-wide loop, starting its daemon thread on first use.
+
+    Cached Temporal clients are bound to the loop they connected on, so every
+    sync caller schedules onto this one loop instead of creating its own.
+    """
+
+    global _loop
+    if _loop is None:
+        with _loop_lock:
+            if _loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="temporal-loop", daemon=True).start()
+                atexit.register(_shutdown_loop, loop)
+                _loop = loop
+    return _loop
+
+
+def register_shutdown_callback(callback: Callable[[], None]) -> None:
+    """Run ``callback`` at exit while the loop is still running (e.g. to flush queues)."""
+
+    with _loop_lock:
+        _shutdown_callbacks.append(callback)
+
+
+async def _cancel_pending_tasks() -> None:
+    current = asyncio.current_task()
+    tasks = [task for task in asyncio.all_tasks() if task is not current]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _shutdown_loop(loop: asyncio.AbstractEventLoop) -> None:
+    """Run shutdown callbacks, then cancel what is left so tasks end cleanly at exit."""
+
+    with _loop_lock:
+        callbacks = list(reversed(_shutdown_callbacks))
+        _shutdown_callbacks.clear()
+    for callback in callbacks:
+        try:
+            callback()
+        except Exception:  # noqa: BLE001 - best effort during interpreter shutdown
+            pass
+    try:
+        asyncio.run_coroutine_threadsafe(_cancel_pending_tasks(), loop).result(timeout=1)
+    except Exception:  # noqa: BLE001 - best effort during interpreter shutdown
+        pass
+    loop.call_soon_threadsafe(loop.stop)
+
+
+def run_sync(coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+    """Run ``coro`` on the background loop and block until it finishes.
+
+    Safe to call from threads that already run their own event loop (e.g. Temporal
+    activities). On timeout the coroutine is cancelled and ``TimeoutError`` raised.
+    """
+
+    future = asyncio.run_coroutine_threadsafe(coro, get_background_loop())
+    try:
+        return future.result(timeout=timeout)
+    except concurrent.futures.TimeoutError:
+        future.cancel()
+        raise
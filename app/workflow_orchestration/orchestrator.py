@@ -5,10 +5,11 @@ from __future__ import annotations
 import asyncio
 import logging
 from dataclasses import dataclass
-from typing import Callable, Dict, Optional, Sequence, Type
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Type
 
 from app.models.platform_event import PlatformEvent
 from app.workflow_orchestration.config import TemporalConfig, get_temporal_config
+from app.workflow_orchestration.loop import run_sync
 from app.workflow_orchestration.starter import WorkflowStarter
 from app.workflow_orchestration.workflows import (
     DocumentVerifiedWorkflow,
@@ -63,42 +64,60 @@ class WorkflowOrchestrator:
     def handle_event(self, event: PlatformEvent) -> None:
         """Start workflows mapped to the supplied event."""
 
-        route = self._routes.get(event.event_type)
-        if not route:
-            return
+        self.handle_events([event])
+
+    def handle_events(self, events: Sequence[PlatformEvent]) -> None:
+        """Start workflows for several events, issuing the Temporal calls concurrently."""
+
+        starts: List[Tuple[PlatformEvent, WorkflowRoute, str]] = []
+        for event in events:
+            route = self._routes.get(event.event_type)
+            if not route:
+                continue
+
+            if not self._config.enabled:
+                LOGGER.debug(
+                    "workflow_skipped_temporal_disabled",
+                    extra={"event_type": event.event_type, "event_id": event.event_id},
+                )
+                continue
 
-        if not self._config.enabled:
-            LOGGER.debug(
-                "workflow_skipped_temporal_disabled",
-                extra={"event_type": event.event_type, "event_id": event.event_id},
-            )
+            starts.append((event, route, self._build_workflow_id(event, route.workflow_class)))
+
+        if not starts:
             return
 
-        workflow_id = self._build_workflow_id(event, route.workflow_class)
-        args = route.args_builder(event)
+        results = run_sync(self._start_workflows(starts))
+        for (event, _, workflow_id), result in zip(starts, results):
+            if isinstance(result, RuntimeError):
+                LOGGER.warning(
+                    "workflow_start_skipped",
+                    extra={"reason": str(result), "event_type": event.event_type},
+                )
+            elif isinstance(result, Exception):
+                LOGGER.error(
+                    "workflow_start_failed",
+                    extra={"workflow_id": workflow_id, "event_type": event.event_type},
+                    exc_info=result,
+                )
+            else:
+                LOGGER.info(
+                    "workflow_started",
+                    extra={"workflow_id": workflow_id, "event_type": event.event_type},
+                )
 
-        try:
-            asyncio.run(
+    async def _start_workflows(self, starts: Sequence[Tuple[PlatformEvent, WorkflowRoute, str]]) -> List[object]:
+        return await asyncio.gather(
+            *(
                 self._starter.start_workflow(
                     workflow_class=route.workflow_class,
                     workflow_id=workflow_id,
-                    args=args,
+                    args=route.args_builder(event),
                 )
-            )
-            LOGGER.info(
-                "workflow_started",
-                extra={"workflow_id": workflow_id, "event_type": event.event_type},
-            )
-        except RuntimeError as exc:
-            LOGGER.warning(
-                "workflow_start_skipped",
-                extra={"reason": str(exc), "event_type": event.event_type},
-            )
-        except Exception:  # noqa: BLE001
-            LOGGER.exception(
-                "workflow_start_failed",
-                extra={"workflow_id": workflow_id, "event_type": event.event_type},
-            )
+                for event, route, workflow_id in starts
+            ),
+            return_exceptions=True,
+        )
 
     @staticmethod
     def _build_workflow_id(event: PlatformEvent, workflow_class: Type) -> str:
@@ -2,16 +2,28 @@
 
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures
 import logging
-from typing import Any, Dict, Optional
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
 
 from temporalio.client import Client, WorkflowHandle
 
 from app.workflow_orchestration.client import get_temporal_client
 from app.workflow_orchestration.config import TemporalConfig, get_temporal_config
+from app.workflow_orchestration.loop import get_background_loop, register_shutdown_callback
 
 logger = logging.getLogger("app.workflow.signal_sender")
 
+# Pending signals beyond this are dropped (and logged) rather than buffered without bound.
+SIGNAL_QUEUE_MAXSIZE = 1000
+# Upper bound on signals sent concurrently by one drain pass.
+SIGNAL_BATCH_SIZE = 50
+# How long close() waits for queued signals to be sent before cancelling the drain task.
+SIGNAL_CLOSE_TIMEOUT_SECONDS = 5.0
+
 
 class WorkflowSignalSender:
     """Send signals to running Temporal workflows."""
@@ -19,13 +31,10 @@ class WorkflowSignalSender:
     def __init__(self, config: Optional[TemporalConfig] = None) -> None:
         """Initialize signal sender."""
         self._config = config or get_temporal_config()
-        self._client: Optional[Client] = None
     
     async def _get_client(self) -> Client:
-        """Get or create Temporal client."""
-        if self._client is None:
-            self._client = await get_temporal_client(self._config)
-        return self._client
+        """Return the shared client for the running loop (connecting on first use there)."""
+        return await get_temporal_client(self._config)
     
     async def send_signal(
         self,
@@ -183,3 +192,138 @@ def get_signal_sender() -> WorkflowSignalSender:
     if _signal_sender is None:
         _signal_sender = WorkflowSignalSender()
     return _signal_sender
+
+
+@dataclass(frozen=True)
+class _PendingSignal:
+    event_id: Optional[str]
+    entity_id: str
+    entity_type: str
+    verification_data: Dict[str, Any]
+
+
+class SignalDispatcher:
+    """Queue document_verified signals and send them from the background loop.
+
+    ``enqueue`` never blocks the caller; a drain task on the shared loop sends
+    whatever has accumulated concurrently, up to ``batch_size`` at a time.
+    ``close`` sends what is still queued and then stops the drain task.
+    """
+
+    def __init__(
+        self,
+        sender: Optional[WorkflowSignalSender] = None,
+        *,
+        maxsize: int = SIGNAL_QUEUE_MAXSIZE,
+        batch_size: int = SIGNAL_BATCH_SIZE,
+    ) -> None:
+        self._sender = sender or get_signal_sender()
+        self._batch_size = batch_size
+        self._loop = get_background_loop()
+        # ``None`` is the stop marker put by close(), after every signal enqueued before it.
+        self._queue: asyncio.Queue[Optional[_PendingSignal]] = asyncio.Queue(maxsize=maxsize)
+        self._closed = False
+        self._drain_future = asyncio.run_coroutine_threadsafe(self._drain(), self._loop)
+
+    def enqueue(
+        self,
+        *,
+        entity_id: str,
+        entity_type: str,
+        verification_data: Dict[str, Any],
+        event_id: Optional[str] = None,
+    ) -> None:
+        """Hand a signal to the drain task without waiting for it to be sent."""
+
+        pending = _PendingSignal(event_id, entity_id, entity_type, verification_data)
+        if self._closed:
+            logger.error(
+                "document_verified_signal_dropped",
+                extra={"entity_id": entity_id, "entity_type": entity_type, "event_id": event_id, "closed": True},
+            )
+            return
+        self._loop.call_soon_threadsafe(self._offer, pending)
+
+    def close(self, timeout: Optional[float] = SIGNAL_CLOSE_TIMEOUT_SECONDS) -> None:
+        """Send the signals still queued, then stop the drain task.
+
+        Waits up to ``timeout`` seconds; whatever is left after that is cancelled
+        and logged rather than silently dropped.
+        """
+
+        if self._closed:
+            return
+        self._closed = True
+        asyncio.run_coroutine_threadsafe(self._queue.put(None), self._loop)
+        try:
+            self._drain_future.result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            self._drain_future.cancel()
+            logger.error("document_verified_signals_dropped_on_close", extra={"queue_size": self._queue.qsize()})
+
+    def _offer(self, pending: _PendingSignal) -> None:
+        try:
+            self._queue.put_nowait(pending)
+        except asyncio.QueueFull:
+            logger.error(
+                "document_verified_signal_dropped",
+                extra={
+                    "entity_id": pending.entity_id,
+                    "entity_type": pending.entity_type,
+                    "event_id": pending.event_id,
+                    "queue_size": self._queue.qsize(),
+                },
+            )
+
+    async def _drain(self) -> None:
+        closing = False
+        while not closing:
+            batch: List[_PendingSignal] = []
+            pending = await self._queue.get()
+            while True:
+                if pending is None:
+                    closing = True
+                    break
+                batch.append(pending)
+                if len(batch) >= self._batch_size or self._queue.empty():
+                    break
+                pending = self._queue.get_nowait()
+            await asyncio.gather(*(self._send(item) for item in batch), return_exceptions=True)
+
+    async def _send(self, pending: _PendingSignal) -> None:
+        extra = {
+            "entity_id": pending.entity_id,
+            "entity_type": pending.entity_type,
+            "event_id": pending.event_id,
+        }
+        try:
+            success = await self._sender.send_document_verified_signal(
+                entity_id=pending.entity_id,
+                entity_type=pending.entity_type,
+                verification_data=pending.verification_data,
+            )
+        except Exception:  # noqa: BLE001 - keep the drain task alive
+            logger.exception("document_verified_signal_dispatch_failed", extra=extra)
+            return
+        if success:
+            logger.info("document_verified_signal_sent_success", extra=extra)
+        else:
+            logger.warning("document_verified_signal_send_failed", extra=extra)
+
+
+_signal_dispatcher: Optional[SignalDispatcher] = None
+_signal_dispatcher_lock = threading.Lock()
+
+
+def get_signal_dispatcher() -> SignalDispatcher:
+    """Get or create the signal dispatcher singleton."""
+    global _signal_dispatcher
+    dispatcher = _signal_dispatcher
+    if dispatcher is not None:
+        return dispatcher
+
+    with _signal_dispatcher_lock:
+        if _signal_dispatcher is None:
+            _signal_dispatcher = SignalDispatcher()
+            register_shutdown_callback(_signal_dispatcher.close)
+        return _signal_dispatcher
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from typing import Any, Sequence, Type
+from typing import Any, Optional, Sequence, Type
 
 from temporalio import workflow as workflow_api
+from temporalio.client import Client
 
 from app.workflow_orchestration.client import get_temporal_client
 from app.workflow_orchestration.config import TemporalConfig, get_temporal_config
@@ -16,6 +17,10 @@ class WorkflowStarter:
     def __init__(self, *, config: TemporalConfig | None = None) -> None:
         self._config = config or get_temporal_config()
 
+    async def _get_client(self) -> Client:
+        """Return the shared client for the running loop (connecting on first use there)."""
+        return await get_temporal_client(self._config)
+
     async def start_workflow(
         self,
         *,
@@ -26,7 +31,7 @@ class WorkflowStarter:
         if not self._config.enabled:
             raise RuntimeError("Temporal service is not configured")
 
-        client = await get_temporal_client(self._config)
+        client = await self._get_client()
         workflow_def = getattr(workflow_class, '__temporal_workflow_definition', None)
         if workflow_def and hasattr(workflow_def, 'name'):
             workflow_name = workflow_def.name
@@ -41,3 +46,14 @@ class WorkflowStarter:
             task_queue=self._config.task_queue,
         )
         return handle.id
+
+
+_workflow_starter: Optional[WorkflowStarter] = None
+
+
+def get_workflow_starter() -> WorkflowStarter:
+    """Return the process-wide workflow starter so its Temporal connection is shared."""
+    global _workflow_starter
+    if _workflow_starter is None:
+        _workflow_starter = WorkflowStarter()
+    return _workflow_starter
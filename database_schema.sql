@@ -127,7 +127,6 @@ CREATE TABLE audit_logs (
     created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
     updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
     CONSTRAINT uq_audit_logs_event_id UNIQUE (event_id),
-    CONSTRAINT uq_audit_logs_sequence UNIQUE (sequence),
     CONSTRAINT ck_audit_logs_previous_hash_length CHECK (length(previous_hash) = 64),
     CONSTRAINT ck_audit_logs_entry_hash_length CHECK (length(entry_hash) = 64)
 );
@@ -157,12 +156,13 @@ CREATE TABLE platform_events (
 -- Entities Indexes
 CREATE INDEX ix_entities_type ON entities(type);
 CREATE INDEX ix_entities_parent ON entities(parent_id);
+CREATE INDEX ix_entities_attributes ON entities USING GIN (attributes jsonb_path_ops);
 
 -- Permissions Indexes
 CREATE INDEX ix_permissions_action ON permissions(action);
 
 -- Role Assignments Indexes
-CREATE INDEX ix_role_assignments_principal ON role_assignments(principal_id);
+CREATE INDEX ix_role_assignments_principal_entity ON role_assignments(principal_id, entity_id);
 CREATE INDEX ix_role_assignments_entity ON role_assignments(entity_id);
 CREATE INDEX ix_role_assignments_role ON role_assignments(role_id);
 
@@ -170,10 +170,14 @@ CREATE INDEX ix_role_assignments_role ON role_assignments(role_id);
 CREATE INDEX ix_audit_logs_actor ON audit_logs(actor_id);
 CREATE INDEX ix_audit_logs_entity ON audit_logs(entity_id);
 CREATE INDEX ix_audit_logs_action ON audit_logs(action);
+CREATE UNIQUE INDEX ix_audit_logs_sequence ON audit_logs(sequence);
 
 -- Platform Events Indexes
-CREATE INDEX ix_platform_events_event_type ON platform_events(event_type);
+CREATE INDEX ix_platform_events_type_occurred_at ON platform_events(event_type, occurred_at);
+CREATE INDEX ix_platform_events_source_occurred_at ON platform_events(source, occurred_at);
 CREATE INDEX ix_platform_events_occurred_at ON platform_events(occurred_at);
+CREATE INDEX ix_platform_events_source_correlation ON platform_events(source, correlation_id)
+    WHERE correlation_id IS NOT NULL;
 
 -- ============================================
 -- TRIGGERS (for updated_at timestamps)
@@ -96,7 +96,6 @@ CREATE TABLE audit_logs (
     created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
     CONSTRAINT uq_audit_logs_event_id UNIQUE (event_id),
-    CONSTRAINT uq_audit_logs_sequence UNIQUE (sequence),
     CONSTRAINT ck_audit_logs_previous_hash_length CHECK (length(previous_hash) = 64),
     CONSTRAINT ck_audit_logs_entry_hash_length CHECK (length(entry_hash) = 64)
 );
@@ -131,7 +130,7 @@ CREATE INDEX ix_entities_parent ON entities(parent_id);
 CREATE INDEX ix_permissions_action ON permissions(action);
 
 -- Role Assignments Indexes
-CREATE INDEX ix_role_assignments_principal ON role_assignments(principal_id);
+CREATE INDEX ix_role_assignments_principal_entity ON role_assignments(principal_id, entity_id);
 CREATE INDEX ix_role_assignments_entity ON role_assignments(entity_id);
 CREATE INDEX ix_role_assignments_role ON role_assignments(role_id);
 
@@ -139,10 +138,14 @@ CREATE INDEX ix_role_assignments_role ON role_assignments(role_id);
 CREATE INDEX ix_audit_logs_actor ON audit_logs(actor_id);
 CREATE INDEX ix_audit_logs_entity ON audit_logs(entity_id);
 CREATE INDEX ix_audit_logs_action ON audit_logs(action);
+CREATE UNIQUE INDEX ix_audit_logs_sequence ON audit_logs(sequence);
 
 -- Platform Events Indexes
-CREATE INDEX ix_platform_events_event_type ON platform_events(event_type);
+CREATE INDEX ix_platform_events_type_occurred_at ON platform_events(event_type, occurred_at);
+CREATE INDEX ix_platform_events_source_occurred_at ON platform_events(source, occurred_at);
 CREATE INDEX ix_platform_events_occurred_at ON platform_events(occurred_at);
+CREATE INDEX ix_platform_events_source_correlation ON platform_events(source, correlation_id)
+    WHERE correlation_id IS NOT NULL;
 
 -- ============================================
 -- END OF SCHEMA
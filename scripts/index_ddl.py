@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+"""CLI utility to print non-blocking PostgreSQL DDL for the model indexes."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from typing import Iterable, Optional, Sequence
+
+from sqlalchemy import Index
+from sqlalchemy.dialects import postgresql
+
+from app.models import Base
+
+
+def create_index_concurrent(
+    name: str,
+    table: str,
+    columns: Sequence[str],
+    *,
+    unique: bool = False,
+    using: Optional[str] = None,
+    where: Optional[str] = None,
+) -> str:
+    """Return a CREATE INDEX CONCURRENTLY statement; it must run outside a transaction."""
+    parts = [f"CREATE {'UNIQUE ' if unique else ''}INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table}"]
+    if using:
+        parts.append(f"USING {using}")
+    parts.append(f"({', '.join(columns)})")
+    if where:
+        parts.append(f"WHERE {where}")
+    return " ".join(parts) + ";"
+
+
+def _index_statement(index: Index) -> str:
+    options = index.dialect_options["postgresql"]
+    ops = options.get("ops") or {}
+    columns = [f"{column.name} {ops[column.name]}" if column.name in ops else column.name for column in index.columns]
+    where = options.get("where")
+    return create_index_concurrent(
+        index.name,
+        index.table.name,
+        columns,
+        unique=bool(index.unique),
+        using=options.get("using"),
+        where=str(where.compile(dialect=postgresql.dialect())) if where is not None else None,
+    )
+
+
+def iter_index_statements(tables: Optional[Iterable[str]] = None) -> Iterable[str]:
+    selected = set(tables) if tables else None
+    for table in Base.metadata.sorted_tables:
+        if selected is not None and table.name not in selected:
+            continue
+        for index in sorted(table.indexes, key=lambda item: item.name or ""):
+            yield _index_statement(index)
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Print CREATE INDEX CONCURRENTLY statements for model indexes.")
+    parser.add_argument("--table", action="append", default=None, help="Limit output to a table (repeatable).")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = parse_args(argv)
+    for statement in iter_index_statements(args.table):
+        print(statement)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
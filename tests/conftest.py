@@ -17,9 +17,9 @@ os.environ["EPR_DOCUMENT_VAULT_TOPIC_ARN"] = ""
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(PROJECT_ROOT))
 
-from app.core.config import get_settings
+from app.core.config import clear_settings_cache
 
-get_settings.cache_clear()
+clear_settings_cache()
 
 from app.core.database import engine  # noqa: E402
 from app.main import create_app  # noqa: E402
@@ -27,6 +27,8 @@ from app.models import Base  # noqa: E402
 from app.events_engine.dispatcher import EventDispatcher, set_event_dispatcher  # noqa: E402
 from app.events_engine.publisher import NullEventPublisher  # noqa: E402
 from app.services import cache as cache_module  # noqa: E402
+from app.services.roles import clear_role_id_cache  # noqa: E402
+from app.services.token_registry import invalidate_token_details  # noqa: E402
 
 
 @pytest.fixture(autouse=True)
@@ -34,6 +36,8 @@ def reset_database():
     Base.metadata.drop_all(bind=engine)
     Base.metadata.create_all(bind=engine)
     cache_module._shared_cache = cache_module.InMemoryPermissionCache()
+    clear_role_id_cache()
+    invalidate_token_details()
     set_event_dispatcher(
         EventDispatcher(publisher=NullEventPublisher(), default_source="entity_permissions_core", max_attempts=2)
     )
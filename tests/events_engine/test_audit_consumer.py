@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from datetime import datetime, timezone
 from uuid import uuid4
 
@@ -26,3 +27,32 @@ def test_audit_consumer_handler_persists_events() -> None:
         entries = session.execute(select(AuditLog)).scalars().all()
         assert entries
         assert entries[-1].action == "issuer.created"
+
+
+def test_audit_consumer_ingests_receive_batch_in_one_transaction() -> None:
+    from app.core.database import session_scope
+    from app.events_engine.consumers.audit import AuditSQSEventConsumer
+
+    consumer = AuditSQSEventConsumer(queue_url="https://sqs.example/audit", region_name="us-east-1")
+    messages = [
+        {
+            "ReceiptHandle": f"rh-{index}",
+            "Body": json.dumps(
+                {
+                    "event_id": str(uuid4()),
+                    "source": "issuer-service",
+                    "action": f"issuer.step_{index}",
+                    "occurred_at": datetime.now(timezone.utc).isoformat(),
+                }
+            ),
+        }
+        for index in range(3)
+    ]
+    messages.insert(1, {"ReceiptHandle": "rh-invalid", "Body": json.dumps({"source": "issuer-service"})})
+
+    handled = consumer._process_messages(messages)
+
+    assert handled == [0, 2, 3]
+    with session_scope() as session:
+        actions = session.execute(select(AuditLog.action).order_by(AuditLog.sequence)).scalars().all()
+    assert actions == ["issuer.step_0", "issuer.step_1", "issuer.step_2"]
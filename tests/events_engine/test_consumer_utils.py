@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import json
 
-from app.events_engine.consumers.base import unwrap_sns_envelope
+from app.events_engine.consumers.base import SQSEventConsumer, unwrap_sns_envelope
 
 
 def test_unwrap_sns_envelope_handles_plain_json() -> None:
@@ -16,3 +16,28 @@ def test_unwrap_sns_envelope_handles_sns_wrapping() -> None:
     body = json.dumps({"Message": json.dumps(inner)})
     result = unwrap_sns_envelope(body)
     assert result == inner
+
+
+def test_consumer_deletes_handled_messages_in_batches() -> None:
+    handled = []
+
+    def handler(message):
+        if message.get("fail"):
+            raise RuntimeError("boom")
+        handled.append(message)
+
+    consumer = SQSEventConsumer(queue_url="https://sqs.example/queue", handler=handler, region_name="us-east-1")
+    delete_calls = []
+    consumer._delete_batch = lambda **kwargs: delete_calls.append(kwargs) or {"Successful": [], "Failed": []}
+
+    messages = [
+        {"ReceiptHandle": f"rh-{index}", "Body": json.dumps({"index": index, "fail": index == 3})}
+        for index in range(12)
+    ]
+    consumer._handle_messages(messages)
+
+    assert len(handled) == 11
+    assert [len(call["Entries"]) for call in delete_calls] == [10, 1]
+    deleted = [entry["ReceiptHandle"] for call in delete_calls for entry in call["Entries"]]
+    assert "rh-3" not in deleted
+    assert len(deleted) == 11
@@ -39,3 +39,48 @@ def test_dispatcher_persists_and_publishes() -> None:
     published = publisher.envelopes[0]
     assert published.event_type == "entity.archived"
     assert published.payload["entity_id"] == "123"
+
+
+def test_dispatcher_publish_events_batches_and_retries_rejected_entries() -> None:
+    from app.events_engine.publisher import PublishBatchError
+    from app.events_engine.schemas import EventEnvelope
+    from app.models.platform_event import DeliveryState
+
+    class BatchPublisher(StubPublisher):
+        def __init__(self) -> None:
+            super().__init__()
+            self.batches = []
+
+        def publish_batch(self, envelopes):
+            self.batches.append(list(envelopes))
+            raise PublishBatchError([envelopes[1]])
+
+    publisher = BatchPublisher()
+    dispatcher = EventDispatcher(publisher=publisher, default_source="test-service")
+    envelopes = [
+        EventEnvelope(event_type="entity.archived", source="test-service", payload={"index": index})
+        for index in range(3)
+    ]
+
+    with session_scope() as session:
+        records = dispatcher.publish_events(session, envelopes)
+        assert [record.delivery_state for record in records] == [DeliveryState.SUCCEEDED] * 3
+        assert len(session.execute(select(PlatformEvent)).scalars().all()) == 3
+
+    assert len(publisher.batches) == 1
+    assert [envelope.payload["index"] for envelope in publisher.envelopes] == [1]
+
+
+def test_envelope_json_bytes_match_pydantic_serialization() -> None:
+    from app.events_engine.schemas import EventEnvelope
+
+    envelope = EventEnvelope(
+        event_type="entity.archived",
+        source="test-service",
+        correlation_id="corr-1",
+        payload={"entity_id": "123"},
+        metadata={"origin": "unit-test"},
+    )
+
+    assert envelope.to_json_bytes().decode("utf-8") == envelope.model_dump_json()
+    assert envelope.to_json_bytes() is envelope.to_json_bytes()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from datetime import datetime, timezone
 from uuid import uuid4
 
 import pytest
@@ -9,9 +10,17 @@ from app.core.database import session_scope
 from app.models.audit_log import AuditLog
 from app.models.entity import EntityStatus, EntityType
 from app.schemas.assignment import RoleAssignmentCreate
+from app.schemas.audit import AuditEvent
 from app.schemas.entity import EntityCreate, EntityUpdate
 from app.schemas.role import RoleCreate
-from app.services.audit import AuditService, GENESIS_HASH
+from app.services.audit import (
+    GENESIS_HASH,
+    HASH_VERSION,
+    LEGACY_HASH_VERSION,
+    AuditService,
+    canonicalize_audit_entry_payload,
+    compute_audit_entry_hash,
+)
 from app.services.audit_verifier import AuditVerifier, AuditVerificationError
 from app.services.entities import EntityService
 from app.services.roles import RoleService
@@ -35,6 +44,26 @@ def test_audit_chain_sequences_and_hashes(client) -> None:
         assert result.checked >= 2
 
 
+def test_audit_record_events_batch_chains_and_deduplicates(client) -> None:
+    first_id = uuid4()
+    with session_scope() as session:
+        AuditService(session).record(action="batch.seed", actor_id=None, entity_id=None, event_id=first_id)
+
+    events = [
+        AuditEvent(event_id=first_id, source="upstream", action="batch.seed"),
+        AuditEvent(event_id=uuid4(), source="upstream", action="batch.one"),
+        AuditEvent(source="upstream", action="batch.two"),
+    ]
+    events.append(events[1])
+    with session_scope() as session:
+        entries = AuditService(session).record_events(events)
+        assert [entry.sequence for entry in entries] == [1, 2, 3, 2]
+
+    with session_scope() as session:
+        result = AuditVerifier(session).verify()
+        assert result.checked == 3
+
+
 def test_audit_chain_tampering_detected(client) -> None:
     event_id = uuid4()
     with session_scope() as session:
@@ -145,3 +174,45 @@ def test_audit_verifier_replay_window(client) -> None:
         result = verifier.verify(start_sequence=2)
         assert result.start_sequence == 2
         assert result.checked == 2
+
+
+def test_audit_verifier_accepts_legacy_hash_version(client) -> None:
+    occurred_at = datetime.now(timezone.utc)
+    details = {"note": "caf\u00e9", "step": 1}
+    canonical_payload = canonicalize_audit_entry_payload(
+        sequence=1,
+        hash_version=LEGACY_HASH_VERSION,
+        event_id=None,
+        source="entity_permissions_core",
+        action="legacy.entry",
+        actor_id=None,
+        actor_type="user",
+        entity_id=None,
+        entity_type=None,
+        correlation_id=None,
+        details=details,
+        occurred_at=occurred_at,
+        previous_hash=GENESIS_HASH,
+    )
+    with session_scope() as session:
+        session.add(
+            AuditLog(
+                sequence=1,
+                previous_hash=GENESIS_HASH,
+                entry_hash=compute_audit_entry_hash(GENESIS_HASH, canonical_payload),
+                hash_version=LEGACY_HASH_VERSION,
+                source="entity_permissions_core",
+                occurred_at=occurred_at,
+                actor_type="user",
+                action="legacy.entry",
+                details=details,
+            )
+        )
+
+    with session_scope() as session:
+        latest = AuditService(session).record(action="current.entry", actor_id=None, entity_id=None, details=details)
+        assert latest.hash_version == HASH_VERSION
+
+    with session_scope() as session:
+        result = AuditVerifier(session).verify()
+        assert result.checked == 2
@@ -208,3 +208,10 @@ def test_authorization_fails_for_archived_entity(client: TestClient) -> None:
     # Authorization should still work (archived entities exist in DB, just marked as archived)
     # This is the expected behavior - archived entities can still be queried for permissions
     assert authorize(client, user_id, "document:upload", entity_id) is True
+
+
+def test_dependencies_share_session_and_cache() -> None:
+    from app.api import dependencies
+
+    assert dependencies.get_db_session is dependencies.get_session
+    assert get_permission_cache() is get_permission_cache()
@@ -82,3 +82,26 @@ def test_archived_entities_hidden_from_list(client: TestClient) -> None:
     ids = [item["id"] for item in list_resp.json()]
     assert entity_id not in ids
 
+
+
+def test_get_entity_conditional_request(client: TestClient) -> None:
+    create_resp = client.post(
+        "/api/v1/entities",
+        json={"name": "Issuer Etag", "type": "issuer", "attributes": {}, "status": "active"},
+    )
+    create_resp.raise_for_status()
+    entity_id = create_resp.json()["id"]
+
+    first = client.get(f"/api/v1/entities/{entity_id}")
+    first.raise_for_status()
+    etag = first.headers["etag"]
+    assert first.json()["name"] == "Issuer Etag"
+
+    cached = client.get(f"/api/v1/entities/{entity_id}", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+    client.patch(f"/api/v1/entities/{entity_id}", json={"attributes": {"tier": "gold"}}).raise_for_status()
+    refreshed = client.get(f"/api/v1/entities/{entity_id}", headers={"If-None-Match": etag})
+    assert refreshed.status_code == 200
+    assert refreshed.headers["etag"] != etag
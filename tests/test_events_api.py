@@ -1,6 +1,13 @@
 from __future__ import annotations
 
+from uuid import UUID
+
 from fastapi.testclient import TestClient
+from sqlalchemy import select
+
+from app.core.database import session_scope
+from app.models.audit_log import AuditLog
+from app.models.entity import Entity
 
 
 def test_event_ingestion_and_listing(client: TestClient) -> None:
@@ -32,3 +39,128 @@ def test_event_ingestion_and_listing(client: TestClient) -> None:
     detail_resp = client.get(f"/api/v1/events/{body['event_id']}")
     detail_resp.raise_for_status()
     assert detail_resp.json()["event_id"] == body["event_id"]
+
+
+def test_property_activated_event_tokenizes_entity(client: TestClient) -> None:
+    entity_resp = client.post(
+        "/api/v1/entities",
+        json={"name": "Harbor Lofts", "type": "offering", "attributes": {"property_status": "pending"}},
+    )
+    entity_resp.raise_for_status()
+    property_id = entity_resp.json()["id"]
+
+    event_resp = client.post(
+        "/api/v1/events",
+        json={
+            "event_type": "property.activated",
+            "source": "tokenization_workflow",
+            "payload": {"property_id": property_id, "contract_address": "0xabc", "total_tokens": 1000},
+        },
+    )
+    event_resp.raise_for_status()
+
+    with session_scope() as session:
+        entity = session.get(Entity, UUID(property_id))
+        assert entity.attributes["property_status"] == "active"
+        assert entity.attributes["smart_contract_address"] == "0xabc"
+        assert entity.attributes["total_tokens"] == 1000
+        audit = session.scalar(select(AuditLog).where(AuditLog.action == "property.tokenized"))
+        assert audit is not None
+        assert audit.details["workflow_event_id"] == event_resp.json()["event_id"]
+
+
+def test_event_batch_ingestion_deduplicates_and_activates(client: TestClient) -> None:
+    first = client.post(
+        "/api/v1/events",
+        json={"event_type": "document.uploaded", "source": "document_vault", "correlation_id": "doc-1"},
+    )
+    first.raise_for_status()
+
+    property_ids = []
+    for name in ("Pier One", "Pier Two"):
+        entity_resp = client.post("/api/v1/entities", json={"name": name, "type": "offering", "attributes": {}})
+        entity_resp.raise_for_status()
+        property_ids.append(entity_resp.json()["id"])
+
+    events = [
+        {"event_type": "document.uploaded", "source": "document_vault", "correlation_id": "doc-1"},
+        {"event_type": "document.uploaded", "source": "document_vault", "correlation_id": "doc-2"},
+        {"event_type": "document.uploaded", "source": "document_vault", "correlation_id": "doc-2"},
+    ] + [
+        {"event_type": "property.activated", "source": "tokenization_workflow", "payload": {"property_id": pid}}
+        for pid in property_ids
+    ]
+    batch_resp = client.post("/api/v1/events/batch", json={"events": events})
+    batch_resp.raise_for_status()
+    body = batch_resp.json()
+
+    assert len(body) == 5
+    assert body[0]["event_id"] == first.json()["event_id"]
+    assert body[1]["event_id"] == body[2]["event_id"]
+    assert len({item["event_id"] for item in body}) == 4
+
+    with session_scope() as session:
+        for pid in property_ids:
+            assert session.get(Entity, UUID(pid)).attributes["property_status"] == "active"
+        audits = session.scalars(select(AuditLog).where(AuditLog.action == "property.tokenized")).all()
+        assert len(audits) == 2
+
+
+def test_property_activation_skips_invalid_ids_in_mixed_batch(client: TestClient) -> None:
+    entity_resp = client.post(
+        "/api/v1/entities",
+        json={"name": "Quay Point", "type": "offering", "attributes": {"property_status": "pending"}},
+    )
+    entity_resp.raise_for_status()
+    property_id = entity_resp.json()["id"]
+
+    events = [
+        {"event_type": "property.activated", "source": "tokenization_workflow", "payload": {"property_id": "bogus"}},
+        {
+            "event_type": "property.activated",
+            "source": "tokenization_workflow",
+            "payload": {"property_id": property_id, "owner_id": "not-a-uuid"},
+        },
+        {"event_type": "property.activated", "source": "tokenization_workflow", "payload": {"property_id": property_id}},
+    ]
+    batch_resp = client.post("/api/v1/events/batch", json={"events": events})
+    batch_resp.raise_for_status()
+    assert len(batch_resp.json()) == 3
+
+    with session_scope() as session:
+        assert session.get(Entity, UUID(property_id)).attributes["property_status"] == "active"
+        audits = session.scalars(select(AuditLog).where(AuditLog.action == "property.tokenized")).all()
+        assert [audit.details["workflow_event_id"] for audit in audits] == [batch_resp.json()[2]["event_id"]]
+
+
+def test_property_activation_failure_rolls_back_updates_but_keeps_events(client: TestClient, monkeypatch) -> None:
+    from app.services.audit import AuditService
+
+    property_ids = []
+    for name in ("Dock One", "Dock Two"):
+        entity_resp = client.post(
+            "/api/v1/entities",
+            json={"name": name, "type": "offering", "attributes": {"property_status": "pending"}},
+        )
+        entity_resp.raise_for_status()
+        property_ids.append(entity_resp.json()["id"])
+
+    def _fail(self, events):
+        raise RuntimeError("audit store unavailable")
+
+    monkeypatch.setattr(AuditService, "record_events", _fail)
+    events = [
+        {"event_type": "property.activated", "source": "tokenization_workflow", "payload": {"property_id": "bogus"}},
+    ] + [
+        {"event_type": "property.activated", "source": "tokenization_workflow", "payload": {"property_id": pid}}
+        for pid in property_ids
+    ]
+    batch_resp = client.post("/api/v1/events/batch", json={"events": events})
+    batch_resp.raise_for_status()
+
+    with session_scope() as session:
+        for pid in property_ids:
+            assert session.get(Entity, UUID(pid)).attributes["property_status"] == "pending"
+        assert session.scalar(select(AuditLog).where(AuditLog.action == "property.tokenized")) is None
+    list_resp = client.get("/api/v1/events", params={"event_type": "property.activated"})
+    assert len(list_resp.json()) == 3
@@ -179,3 +179,34 @@ def test_filter_properties_by_status(client: TestClient) -> None:
 
 
 
+
+
+def test_list_properties_pagination_total(client: TestClient) -> None:
+    """Test that total reflects all matches regardless of the requested page."""
+    agent_id = create_agent(client)
+    owner_id = create_property_owner(client, agent_id)
+    
+    for i in range(3):
+        client.post(
+            "/api/v1/properties",
+            json={
+                "name": f"Paged Property {i}",
+                "owner_id": owner_id,
+                "property_type": "commercial",
+                "address": f"{i} Page St",
+                "valuation": 1000000,
+                "total_tokens": 10000,
+                "token_price": 100,
+            },
+            headers={"X-Actor-Id": agent_id},
+        ).raise_for_status()
+    
+    first_page = client.get("/api/v1/properties", params={"owner_id": owner_id, "page_size": 2})
+    first_page.raise_for_status()
+    assert first_page.json()["total"] == 3
+    assert len(first_page.json()["properties"]) == 2
+    
+    past_end = client.get("/api/v1/properties", params={"owner_id": owner_id, "page": 5, "page_size": 2})
+    past_end.raise_for_status()
+    assert past_end.json()["total"] == 3
+    assert past_end.json()["properties"] == []
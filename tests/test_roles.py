@@ -133,3 +133,47 @@ def test_role_duplicate_conflict(client: TestClient) -> None:
     duplicate = client.post("/api/v1/roles", json=payload)
     assert duplicate.status_code == 409
     assert "already exists" in duplicate.json()["detail"]
+
+
+def test_onboarding_resolves_seeded_role_ids(client: TestClient) -> None:
+    client.post("/api/v1/setup/initialize-demo").raise_for_status()
+    roles = {role["name"]: role["id"] for role in client.get("/api/v1/roles").json()}
+
+    for name in ("Owner One LLC", "Owner Two LLC"):
+        response = client.post(
+            "/api/v1/onboarding/property-owner",
+            json={"name": name, "company_name": name, "contact_email": "owner@test.com"},
+        )
+        response.raise_for_status()
+        body = response.json()
+        assert body["role_assigned"] is True
+        assert body["role_id"] == roles["PropertyOwner"]
+
+
+def test_warm_role_id_cache_preloads_all_roles(client: TestClient) -> None:
+    from app.core.database import session_scope
+    from app.services.roles import get_role_id_by_name, warm_role_id_cache
+
+    client.post("/api/v1/setup/initialize-demo").raise_for_status()
+    roles = {role["name"]: role["id"] for role in client.get("/api/v1/roles").json()}
+
+    with session_scope() as session:
+        assert warm_role_id_cache(session) == len(roles)
+
+    class NoQuerySession:
+        def scalar(self, *args, **kwargs):
+            raise AssertionError("role lookup should be served from the cache")
+
+    assert str(get_role_id_by_name(NoQuerySession(), "InvestorPending")) == roles["InvestorPending"]
+
+
+def test_role_responses_render_utc_timestamps_like_pydantic() -> None:
+    from datetime import datetime, timezone
+
+    from pydantic import TypeAdapter
+
+    from app.api.responses import UTCJSONResponse
+
+    stamp = datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc)
+    body = UTCJSONResponse({"created_at": stamp}).body
+    assert body == b'{"created_at":' + TypeAdapter(datetime).dump_json(stamp) + b"}"
@@ -2,7 +2,17 @@
 
 from __future__ import annotations
 
+from uuid import uuid4
+
 from fastapi.testclient import TestClient
+from sqlalchemy import select
+
+from app.core.database import SessionLocal
+from app.services.token_registry import (
+    cache_token_details,
+    get_cached_token_details,
+    invalidate_token_details_on_commit,
+)
 
 
 def setup_demo_environment(client: TestClient) -> dict:
@@ -115,6 +125,77 @@ def test_get_token_details(client: TestClient) -> None:
     assert token_data["available_tokens"] == 30000
 
 
+def test_token_details_cache_invalidated_by_property_update(client: TestClient) -> None:
+    """Cached token details are dropped when the property is updated in-process."""
+    demo = setup_demo_environment(client)
+    agent_id = demo["agent_id"]
+    
+    owner_response = client.post(
+        "/api/v1/onboarding/property-owner",
+        json={
+            "name": "Cache Test Owner",
+            "company_name": "Cache Test LLC",
+            "contact_email": "cache@test.com",
+        },
+        headers={"X-Actor-Id": agent_id},
+    )
+    owner_id = owner_response.json()["entity_id"]
+    
+    property_response = client.post(
+        "/api/v1/properties",
+        json={
+            "name": "Cached Property",
+            "owner_id": owner_id,
+            "property_type": "residential",
+            "address": "1 Cache Ln",
+            "valuation": 1000000,
+            "total_tokens": 10000,
+            "token_price": 100,
+        },
+        headers={"X-Actor-Id": agent_id},
+    )
+    property_id = property_response.json()["id"]
+    
+    assert client.get(f"/api/v1/tokens/{property_id}").json()["token_price"] == 100.0
+    
+    update_response = client.patch(
+        f"/api/v1/properties/{property_id}",
+        json={"token_price": 125},
+        headers={"X-Actor-Id": agent_id},
+    )
+    update_response.raise_for_status()
+    
+    assert client.get(f"/api/v1/tokens/{property_id}").json()["token_price"] == 125.0
+    
+    activation_response = client.post(
+        "/api/v1/events",
+        json={
+            "event_type": "property.activated",
+            "source": "tokenization_workflow",
+            "payload": {
+                "property_id": property_id,
+                "contract_address": "0xcache",
+                "total_tokens": 20000,
+            },
+        },
+    )
+    activation_response.raise_for_status()
+    
+    token_data = client.get(f"/api/v1/tokens/{property_id}").json()
+    assert token_data["smart_contract_address"] == "0xcache"
+    assert token_data["total_tokens"] == 20000
+    
+    attributes = client.get(f"/api/v1/entities/{property_id}").json()["attributes"]
+    entity_response = client.patch(
+        f"/api/v1/entities/{property_id}",
+        json={"attributes": {**attributes, "token_price": 77}},
+        headers={"X-Actor-Id": agent_id},
+    )
+    entity_response.raise_for_status()
+    
+    assert client.get(f"/api/v1/tokens/{property_id}").json()["token_price"] == 77.0
+
+
 def test_create_sample_data(client: TestClient) -> None:
     """Test creating sample data for demo."""
     # Initialize first
@@ -229,3 +310,88 @@ def test_investor_pending_cannot_purchase(client: TestClient) -> None:
 
 
 
+
+
+def test_repeat_purchase_starts_new_workflow_after_first_completes(client: TestClient, monkeypatch) -> None:
+    """A duplicate is suppressed only while the purchase workflow is still running."""
+    from temporalio.exceptions import WorkflowAlreadyStartedError
+
+    from app.api.routers import tokens as tokens_router
+    from app.workflow_orchestration.config import TemporalConfig
+    from app.workflow_orchestration.starter import get_workflow_starter
+
+    class StubStarter:
+        def __init__(self) -> None:
+            self.started: list[str] = []
+            self.running: set[str] = set()
+
+        async def start_workflow(self, *, workflow_class, workflow_id, args):
+            if workflow_id in self.running:
+                raise WorkflowAlreadyStartedError(workflow_id, workflow_class.__name__)
+            self.running.add(workflow_id)
+            self.started.append(workflow_id)
+            return workflow_id
+
+    starter = StubStarter()
+    client.app.dependency_overrides[get_workflow_starter] = lambda: starter
+    monkeypatch.setattr(
+        tokens_router,
+        "get_temporal_config",
+        lambda: TemporalConfig(
+            host="localhost:7233", namespace="test", api_key="dummy", task_queue="unit-tests", tls_enabled=False
+        ),
+    )
+
+    investor = client.post(
+        "/api/v1/entities",
+        json={"name": "Repeat Buyer", "type": "investor", "attributes": {"kyc_status": "verified"}},
+    )
+    investor.raise_for_status()
+    offering = client.post(
+        "/api/v1/entities",
+        json={
+            "name": "Repeat Tower",
+            "type": "offering",
+            "attributes": {"property_status": "active", "available_tokens": 100, "token_price": 10},
+        },
+    )
+    offering.raise_for_status()
+    purchase = {
+        "investor_id": investor.json()["id"],
+        "property_id": offering.json()["id"],
+        "token_quantity": 5,
+        "payment_method": "card",
+    }
+
+    try:
+        first = client.post("/api/v1/tokens/purchase", json=purchase)
+        assert first.json()["status"] == "started"
+        duplicate = client.post("/api/v1/tokens/purchase", json=purchase)
+        assert duplicate.json()["message"] == "Token purchase workflow already in progress"
+        assert len(starter.started) == 1
+
+        starter.running.clear()  # first workflow completed
+        repeat = client.post("/api/v1/tokens/purchase", json=purchase)
+        assert repeat.json()["message"] == "Token purchase workflow started successfully"
+        assert len(starter.started) == 2
+    finally:
+        client.app.dependency_overrides.pop(get_workflow_starter, None)
+
+
+def test_token_details_invalidated_only_after_commit() -> None:
+    """Pending invalidations are applied on commit and discarded on rollback."""
+    property_id = uuid4()
+    cache_token_details(property_id, {"token_price": 100.0})
+
+    with SessionLocal() as session:
+        session.execute(select(1))
+        invalidate_token_details_on_commit(session, property_id)
+        assert get_cached_token_details(property_id) is not None
+        session.rollback()
+        session.commit()
+    assert get_cached_token_details(property_id) is not None
+
+    with SessionLocal() as session:
+        invalidate_token_details_on_commit(session, property_id)
+        session.commit()
+    assert get_cached_token_details(property_id) is None
@@ -68,3 +68,188 @@ def test_orchestrator_skips_when_temporal_disabled() -> None:
     orchestrator = WorkflowOrchestrator(starter=starter, config=disabled_config)
     orchestrator.handle_event(_build_event("entity.archived"))
     assert starter.calls == []
+
+
+def test_run_sync_works_inside_running_loop() -> None:
+    import asyncio
+
+    from app.workflow_orchestration.loop import get_background_loop, run_sync
+
+    async def _loop_of_coroutine():
+        return asyncio.get_running_loop()
+
+    async def _caller():
+        # Mirrors an activity calling sync service code while its own loop is running.
+        return run_sync(_loop_of_coroutine(), timeout=5)
+
+    assert asyncio.run(_caller()) is get_background_loop()
+    assert run_sync(_loop_of_coroutine(), timeout=5) is get_background_loop()
+
+
+def test_signal_dispatcher_sends_queued_signals_in_background() -> None:
+    import time
+
+    from app.workflow_orchestration.signal_sender import SignalDispatcher
+
+    class StubSender:
+        def __init__(self) -> None:
+            self.calls: list[str] = []
+
+        async def send_document_verified_signal(self, *, entity_id, entity_type, verification_data):
+            self.calls.append(entity_id)
+            return entity_id != "bad"
+
+    sender = StubSender()
+    dispatcher = SignalDispatcher(sender, maxsize=10, batch_size=2)
+    try:
+        for entity_id in ("a", "bad", "c"):
+            dispatcher.enqueue(entity_id=entity_id, entity_type="property", verification_data={"approved": True})
+
+        deadline = time.monotonic() + 5
+        while len(sender.calls) < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert sorted(sender.calls) == ["a", "bad", "c"]
+    finally:
+        dispatcher.close()
+
+
+def test_signal_dispatcher_close_sends_queued_signals() -> None:
+    import asyncio
+
+    from app.workflow_orchestration.signal_sender import SignalDispatcher
+
+    class SlowSender:
+        def __init__(self) -> None:
+            self.calls: list[str] = []
+
+        async def send_document_verified_signal(self, *, entity_id, entity_type, verification_data):
+            await asyncio.sleep(0.01)
+            self.calls.append(entity_id)
+            return True
+
+    sender = SlowSender()
+    dispatcher = SignalDispatcher(sender, maxsize=10, batch_size=2)
+    try:
+        for entity_id in ("a", "b", "c", "d", "e"):
+            dispatcher.enqueue(entity_id=entity_id, entity_type="property", verification_data={"approved": True})
+    finally:
+        dispatcher.close()
+
+    assert sorted(sender.calls) == ["a", "b", "c", "d", "e"]
+    assert dispatcher._drain_future.done() and not dispatcher._drain_future.cancelled()
+    dispatcher.enqueue(entity_id="late", entity_type="property", verification_data={})
+    assert "late" not in sender.calls
+
+
+def test_orchestrator_starts_workflows_for_event_batch_concurrently() -> None:
+    import asyncio
+
+    class GatedStarter(StubStarter):
+        def __init__(self) -> None:
+            super().__init__()
+            self.in_flight = 0
+            self.max_in_flight = 0
+
+        async def start_workflow(self, *, workflow_class, workflow_id, args):
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(0.01)
+            self.in_flight -= 1
+            return await super().start_workflow(workflow_class=workflow_class, workflow_id=workflow_id, args=args)
+
+    starter = GatedStarter()
+    config = TemporalConfig(
+        host="localhost:7233",
+        namespace="test",
+        api_key="dummy",
+        task_queue="unit-tests",
+        tls_enabled=False,
+    )
+    orchestrator = WorkflowOrchestrator(starter=starter, config=config)
+
+    orchestrator.handle_events(
+        [_build_event("entity.archived"), _build_event("document.uploaded"), _build_event("role.updated")]
+    )
+
+    assert len(starter.calls) == 2
+    assert starter.max_in_flight == 2
+
+
+def test_temporal_clients_are_cached_per_event_loop(monkeypatch) -> None:
+    import asyncio
+
+    from app.workflow_orchestration import client as client_module
+    from app.workflow_orchestration.loop import run_sync
+
+    connects: list[asyncio.AbstractEventLoop] = []
+
+    async def fake_connect(*args, **kwargs):
+        connects.append(asyncio.get_running_loop())
+        await asyncio.sleep(0)
+        return object()
+
+    monkeypatch.setattr(client_module.Client, "connect", fake_connect)
+    config = TemporalConfig(
+        host="localhost:7233",
+        namespace="per-loop-test",
+        api_key="dummy",
+        task_queue="unit-tests",
+        tls_enabled=False,
+    )
+
+    async def _concurrent_gets():
+        return await asyncio.gather(*(client_module.get_temporal_client(config) for _ in range(3)))
+
+    background = run_sync(_concurrent_gets(), timeout=5)
+    assert len({id(client) for client in background}) == 1
+    assert run_sync(client_module.get_temporal_client(config), timeout=5) is background[0]
+
+    # A different loop (e.g. uvicorn's) gets its own client instead of reusing one bound elsewhere.
+    other = asyncio.run(_concurrent_gets())
+    assert other[0] is not background[0]
+    assert len(connects) == 2
+
+
+@pytest.mark.parametrize(
+    ("execution_status", "expected"),
+    [
+        ("RUNNING", {"status": "running"}),
+        ("COMPLETED", {"status": "completed", "result": {"verified": True}}),
+        ("FAILED", {"status": "failed"}),
+        ("TERMINATED", {"status": "terminated"}),
+    ],
+)
+def test_workflow_status_reports_temporal_execution_status(client, monkeypatch, execution_status, expected) -> None:
+    from types import SimpleNamespace
+
+    from temporalio.client import WorkflowExecutionStatus
+
+    from app.api.routers import workflows as workflows_router
+
+    class StubHandle:
+        async def describe(self):
+            return SimpleNamespace(status=WorkflowExecutionStatus[execution_status])
+
+        async def result(self):
+            return {"verified": True}
+
+    class StubClient:
+        def get_workflow_handle(self, workflow_id):
+            return StubHandle()
+
+    async def _get_client(config):
+        return StubClient()
+
+    monkeypatch.setattr(
+        workflows_router,
+        "get_temporal_config",
+        lambda: TemporalConfig(
+            host="localhost:7233", namespace="test", api_key="dummy", task_queue="unit-tests", tls_enabled=False
+        ),
+    )
+    monkeypatch.setattr(workflows_router, "get_temporal_client", _get_client)
+
+    response = client.get("/api/v1/workflows/document-verification/document-verification-1/status")
+
+    assert response.status_code == 200
+    assert response.json() == {"workflow_id": "document-verification-1", **expected}